@@ -1,18 +1,14 @@
 import json
-import sys
-import os
 import requests
 from datetime import datetime
 from typing import List, Dict
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
-
+# Import from layer
 from shared.database import get_db_session, Game, School
 from shared.responses import success_response, error_response
 from shared.parameter_store import get_cfb_api_key
 from shared.week_utils import get_all_api_week_params_for_season
-from shared.game_utils import process_api_game, validate_game_teams, create_new_game, update_existing_game
+from shared.game_utils import process_api_game, validate_game_teams, create_new_game, update_existing_game, refresh_school_season_records
 from sqlalchemy import text
 
 # CollegeFootballData API configuration
@@ -160,6 +156,9 @@ def lambda_handler(event, context):
                 total_games_updated += games_updated
                 total_games_skipped += games_skipped
             
+            # Recompute school records once for everything loaded (or deleted) above
+            refresh_school_season_records(db)
+            
             return success_response({
                 'seasons': seasons,
                 'total_games_deleted': total_games_deleted,
@@ -1,18 +1,14 @@
 import json
-import sys
-import os
 import requests
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Tuple
 
-# Add shared modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'shared'))
-
+# Import from layer
 from shared.database import get_db_session, Game, School
 from shared.responses import success_response, error_response
 from shared.parameter_store import get_cfb_api_key
 from shared.week_utils import get_current_week_of_season, get_api_week_params
-from shared.game_utils import process_api_game
+from shared.game_utils import process_api_game, refresh_school_season_records
 
 # CollegeFootballData API configuration
 CFB_API_BASE = "https://api.collegefootballdata.com"
@@ -175,6 +171,7 @@ def lambda_handler(event, context):
             
             # Commit all changes
             db.commit()
+            refresh_school_season_records(db)
             
             return success_response({
                 'season': season,
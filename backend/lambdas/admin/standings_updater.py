@@ -6,9 +6,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
 # Import from shared layer
+from shared.connections import query_league_connections, post_to_connections
 from shared.database import get_db_session, League, User, LeagueTeam, LeagueTeamSchoolAssignment, School, Game
 from sqlalchemy.orm import joinedload
-from sqlalchemy import and_, or_, text
+from sqlalchemy import and_, text
 
 # DynamoDB for WebSocket connections
 dynamodb = boto3.resource('dynamodb')
@@ -94,6 +95,19 @@ def calculate_league_standings(db, league: League) -> Dict[str, Any]:
         LeagueTeam.league_id == league.id
     ).all()
     
+    # Read school records from the same school_season_records materialized view the
+    # standings endpoint uses, so broadcast and REST standings always agree
+    school_records = {
+        school_id: (wins, losses, total_games)
+        for school_id, wins, losses, total_games in db.execute(text("""
+            SELECT r.school_id, r.wins, r.losses, r.total_games
+            FROM school_season_records r
+            WHERE r.season = :season AND r.school_id IN (
+                SELECT school_id FROM league_team_school_assignments WHERE league_id = :league_id
+            )
+        """), {'season': league.season, 'league_id': league.id}).all()
+    }
+    
     members = []
     
     for league_team in league_members:
@@ -116,30 +130,9 @@ def calculate_league_standings(db, league: League) -> Dict[str, Any]:
         for assignment in school_assignments:
             school = assignment.school
             
-            # Count wins for this school
-            wins_query = db.query(Game).filter(
-                and_(
-                    Game.season == league.season,
-                    Game.completed == True,
-                    or_(
-                        and_(Game.home_id == school.id, Game.home_points > Game.away_points),
-                        and_(Game.away_id == school.id, Game.away_points > Game.home_points)
-                    )
-                )
-            )
-            school_wins = wins_query.count()
+            # Schools with no completed games have no row in the view
+            school_wins, school_losses, school_games = school_records.get(school.id, (0, 0, 0))
             total_wins += school_wins
-            
-            # Count total completed games for this school
-            games_query = db.query(Game).filter(
-                and_(
-                    Game.season == league.season,
-                    Game.completed == True,
-                    or_(Game.home_id == school.id, Game.away_id == school.id)
-                )
-            )
-            school_games = games_query.count()
-            school_losses = school_games - school_wins
             total_losses += school_losses
             total_games += school_games
             
@@ -231,12 +224,9 @@ def broadcast_standings_update(league_id: str, standings_data: Dict[str, Any], r
     
     try:
         # Get all WebSocket connections for this league
-        response = connections_table.scan(
-            FilterExpression='league_id = :league_id',
-            ExpressionAttributeValues={':league_id': str(league_id)}
-        )
+        connections = query_league_connections(connections_table, league_id)
         
-        if not response.get('Items'):
+        if not connections:
             print(f"📡 No WebSocket connections found for league {league_id}")
             return True
         
@@ -257,26 +247,13 @@ def broadcast_standings_update(league_id: str, standings_data: Dict[str, Any], r
             'timestamp': datetime.utcnow().isoformat()
         }
         
-        successful_sends = 0
-        failed_sends = 0
-        
-        # Send to all connections
-        for item in response['Items']:
-            connection_id = item['connection_id']
-            
-            try:
-                api_gateway.post_to_connection(
-                    ConnectionId=connection_id,
-                    Data=json.dumps(message)
-                )
-                successful_sends += 1
-            except api_gateway.exceptions.GoneException:
-                # Connection is stale, remove it
-                connections_table.delete_item(Key={'connection_id': connection_id})
-                failed_sends += 1
-            except Exception as e:
-                print(f"❌ Error sending to connection {connection_id}: {str(e)}")
-                failed_sends += 1
+        # Send to all connections concurrently; stale ones are removed
+        successful_sends, failed_sends = post_to_connections(
+            api_gateway,
+            connections_table,
+            [item['connection_id'] for item in connections],
+            json.dumps(message)
+        )
         
         print(f"📡 Broadcast to league {league_id}: {successful_sends} successful, {failed_sends} failed")
         return successful_sends > 0
@@ -4,7 +4,7 @@ import os
 
 # Import from layer
 from shared.database import get_db_session, User
-from shared.responses import success_response, error_response, validation_error_response
+from shared.responses import success_response, error_response, validation_error_response, parse_body
 from shared.auth import verify_password, create_jwt_token
 
 def lambda_handler(event, context):
@@ -14,7 +14,7 @@ def lambda_handler(event, context):
         if not event.get('body'):
             return validation_error_response({'body': 'Request body is required'})
         
-        body = json.loads(event['body'])
+        body = parse_body(event)
         email = body.get('email', '').strip().lower()
         password = body.get('password', '')
         
@@ -5,7 +5,7 @@ import re
 
 # Import from layer
 from shared.database import get_db_session, User
-from shared.responses import success_response, error_response, validation_error_response
+from shared.responses import success_response, error_response, validation_error_response, log_exception, parse_body
 from shared.auth import hash_password, create_jwt_token
 from sqlalchemy.exc import IntegrityError
 
@@ -21,7 +21,7 @@ def lambda_handler(event, context):
         if not event.get('body'):
             return validation_error_response({'body': 'Request body is required'})
         
-        body = json.loads(event['body'])
+        body = parse_body(event)
         email = body.get('email', '').strip().lower()
         password = body.get('password', '')
         display_name = body.get('displayName', '').strip()
@@ -90,8 +90,5 @@ def lambda_handler(event, context):
     except json.JSONDecodeError:
         return validation_error_response({'body': 'Invalid JSON format'})
     except Exception as e:
-        print(f"Signup error: {str(e)}")
-        print(f"Signup error type: {type(e)}")
-        import traceback
-        print(f"Signup traceback: {traceback.format_exc()}")
+        log_exception("Signup", e)
         return error_response('Signup failed', 500)
@@ -9,7 +9,7 @@ import os
 
 # Import from layer
 from shared.database import get_db_session, User
-from shared.responses import success_response, error_response, validation_error_response
+from shared.responses import success_response, error_response, validation_error_response, parse_body
 from shared.auth import require_auth, get_user_id_from_event
 
 def validate_email(email):
@@ -24,7 +24,7 @@ def lambda_handler(event, context):
         if not event.get('body'):
             return validation_error_response({'body': 'Request body is required'})
         
-        body = json.loads(event['body'])
+        body = parse_body(event)
         new_email = body.get('email', '').strip().lower() if body.get('email') else None
         new_display_name = body.get('displayName', '').strip() if body.get('displayName') else None
         
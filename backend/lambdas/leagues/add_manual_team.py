@@ -10,8 +10,9 @@ import os
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, User
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception, parse_body
 from shared.auth import require_auth, get_user_id_from_event, hash_password
+from shared.cache import invalidate_league_cache
 from sqlalchemy.exc import IntegrityError
 
 @require_auth
@@ -24,9 +25,7 @@ def lambda_handler(event, context):
             return validation_error_response({'id': 'League ID is required'})
         
         # Parse body
-        body = event.get('body', '{}')
-        if isinstance(body, str):
-            body = json.loads(body)
+        body = parse_body(event)
         
         user_id = get_user_id_from_event(event)
         
@@ -82,7 +81,8 @@ def lambda_handler(event, context):
             dummy_user = User(
                 email=dummy_email,
                 password_hash=hash_password('dummy_password_' + uuid.uuid4().hex[:16]),  # Random password
-                display_name=player_name  # Use the player name as display name
+                display_name=player_name,  # Use the player name as display name
+                is_manual=True
             )
             
             db.add(dummy_user)
@@ -98,6 +98,7 @@ def lambda_handler(event, context):
             
             db.add(new_team)
             db.commit()
+            invalidate_league_cache(league_id)
             db.refresh(dummy_user)
             db.refresh(new_team)
             
@@ -126,7 +127,5 @@ def lambda_handler(event, context):
     except json.JSONDecodeError:
         return validation_error_response({'body': 'Invalid JSON format'})
     except Exception as e:
-        print(f"Add manual team error: {str(e)}")
-        import traceback
-        print(f"Add manual team traceback: {traceback.format_exc()}")
+        log_exception("Add manual team", e)
         return error_response('Failed to add manual team', 500)
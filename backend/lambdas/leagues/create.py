@@ -6,7 +6,7 @@ import string
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, User
-from shared.responses import success_response, error_response, validation_error_response
+from shared.responses import success_response, error_response, validation_error_response, log_exception, parse_body
 from shared.auth import require_auth, get_user_id_from_event
 
 def generate_join_code():
@@ -21,7 +21,7 @@ def lambda_handler(event, context):
         if not event.get('body'):
             return validation_error_response({'body': 'Request body is required'})
         
-        body = json.loads(event['body'])
+        body = parse_body(event)
         name = body.get('name', '').strip()
         season = body.get('season', 2025)
         team_name = body.get('teamName', '').strip()
@@ -116,8 +116,5 @@ def lambda_handler(event, context):
     except json.JSONDecodeError:
         return validation_error_response({'body': 'Invalid JSON format'})
     except Exception as e:
-        print(f"Create league error: {str(e)}")
-        print(f"Create league error type: {type(e)}")
-        import traceback
-        print(f"Create league traceback: {traceback.format_exc()}")
+        log_exception("Create league", e)
         return error_response('Failed to create league', 500)
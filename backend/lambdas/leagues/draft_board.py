@@ -4,7 +4,7 @@ import os
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment, School, User
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception
 from shared.auth import require_auth, get_user_id_from_event
 
 @require_auth
@@ -86,8 +86,5 @@ def lambda_handler(event, context):
             db.close()
             
     except Exception as e:
-        print(f"Draft board error: {str(e)}")
-        print(f"Draft board error type: {type(e)}")
-        import traceback
-        print(f"Draft board traceback: {traceback.format_exc()}")
+        log_exception("Draft board", e)
         return error_response('Failed to fetch draft board', 500)
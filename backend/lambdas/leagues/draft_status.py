@@ -4,7 +4,7 @@ import os
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment, User, LeagueDraft
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception
 from shared.auth import require_auth, get_user_id_from_event
 from sqlalchemy import func
 
@@ -142,8 +142,5 @@ def lambda_handler(event, context):
             db.close()
             
     except Exception as e:
-        print(f"Draft status error: {str(e)}")
-        print(f"Draft status error type: {type(e)}")
-        import traceback
-        print(f"Draft status traceback: {traceback.format_exc()}")
+        log_exception("Draft status", e)
         return error_response('Failed to fetch draft status', 500)
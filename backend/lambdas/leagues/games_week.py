@@ -1,23 +1,41 @@
 import json
 import sys
 import os
+import logging
 from datetime import datetime, timezone
 from collections import defaultdict
+from functools import lru_cache
 
 # Import from layer
 from shared.database import get_db_session, League, User, LeagueTeam, LeagueTeamSchoolAssignment, School, Game
-from shared.responses import success_response, error_response, not_found_response
+from shared.responses import success_response, error_response, not_found_response, log_exception
 from shared.auth import require_auth, get_user_uuid_from_event
 from shared.week_utils import get_current_week_of_season, get_week_info
-from sqlalchemy.orm import joinedload
+from shared.cache import cache_enabled, get_cached_json, set_cached_json
+from sqlalchemy.orm import joinedload, aliased
 from sqlalchemy import and_, or_, text
 
+# Progress and cache details are info level; LOG_LEVEL decides whether they reach CloudWatch
+logger = logging.getLogger(__name__)
+
+# Short TTL bounds staleness for data the version key doesn't track
+# (scheduled -> in_progress by the clock, team/display name edits)
+WEEK_CACHE_TTL_SECONDS = 60
+
+# (quarter, time remaining) estimates for in-progress games, one per 14 points scored
+QUARTER_ESTIMATES = ((1, "12:30"), (2, "8:45"), (3, "5:15"), (4, "2:30"))
+
+@lru_cache(maxsize=4096)
+def _format_score(school_points: int, opponent_points: int) -> str:
+    """Format a score line - scores are small ints, so most pairs repeat across rows"""
+    return f"{school_points}-{opponent_points}"
+
 def lambda_handler(event, context):
     """Get league games for a specific week with member team performance - OPTIMIZED VERSION
     
     Performance improvements:
-    - Reduced from ~72 queries to ~3 queries total
-    - Batch fetches all games for the week at once
+    - Reduced from ~72 queries to a single joined query for members, games and opponents
+    - Streams rows and builds the response lookups in one pass
     - 10-20x faster response time
     """
     try:
@@ -51,15 +69,38 @@ def lambda_handler(event, context):
             if week < 1 or week > 21:
                 return error_response('Week must be between 1 and 21', 400)
             
+            # The payload only changes when this week's games or the league's
+            # membership/draft change, so key the cached response on those
+            cache_key = None
+            if cache_enabled():
+                version = db.execute(text("""
+                    SELECT
+                        (SELECT MAX(updated_at) FROM games WHERE season = :season AND week = :week),
+                        (SELECT COUNT(*) FROM league_teams WHERE league_id = :league_id),
+                        (SELECT COUNT(*) FROM league_team_school_assignments WHERE league_id = :league_id),
+                        (SELECT MAX(drafted_at) FROM league_team_school_assignments WHERE league_id = :league_id)
+                """), {'season': season, 'week': week, 'league_id': league_id}).first()
+                cache_key = f"gw:{league_id}:{week}:" + ":".join(str(v) for v in version)
+                cached = get_cached_json(cache_key)
+                if cached is not None:
+                    logger.info("⚡ Cache hit for league %s week %s", league_id, week)
+                    return cached
+            
             # Get week metadata
             week_info = get_week_info(week, season)
             
-            print(f"🚀 OPTIMIZED: Fetching games for league {league.name}, season {season}, week {week}")
+            logger.info("🚀 OPTIMIZED: Fetching games for league %s, season %s, week %s", league.name, season, week)
             
             # =====================================================
-            # QUERY 1: Get all league members and their teams
+            # SINGLE QUERY: members -> drafted schools -> this week's games -> opponent
             # =====================================================
-            league_members_query = db.query(
+            # One round-trip instead of separate member, game and opponent queries.
+            # A school can appear on several rows when it plays more than once in a week.
+            # games.start_date is stored as naive UTC, so compare against naive UTC now
+            current_time = datetime.now(timezone.utc).replace(tzinfo=None)
+            
+            opponent_school = aliased(School)
+            week_rows = db.query(
                 LeagueTeam.user_id,
                 User.display_name,
                 LeagueTeam.team_name,
@@ -67,7 +108,15 @@ def lambda_handler(event, context):
                 School.name.label('school_name'),
                 School.mascot,
                 School.conference,
-                School.primary_color
+                School.primary_color,
+                Game.home_id,
+                Game.away_id,
+                Game.home_points,
+                Game.away_points,
+                Game.completed,
+                Game.start_date,
+                opponent_school.name.label('opponent_name'),
+                opponent_school.primary_color.label('opponent_color')
             ).join(
                 User, LeagueTeam.user_id == User.id
             ).outerjoin(
@@ -78,24 +127,44 @@ def lambda_handler(event, context):
                 )
             ).outerjoin(
                 School, LeagueTeamSchoolAssignment.school_id == School.id
+            ).outerjoin(
+                Game,
+                and_(
+                    Game.season == season,
+                    Game.week == week,
+                    or_(
+                        Game.home_id == LeagueTeamSchoolAssignment.school_id,
+                        Game.away_id == LeagueTeamSchoolAssignment.school_id
+                    )
+                )
+            ).outerjoin(
+                opponent_school,
+                or_(
+                    and_(Game.home_id == LeagueTeamSchoolAssignment.school_id, opponent_school.id == Game.away_id),
+                    and_(Game.away_id == LeagueTeamSchoolAssignment.school_id, opponent_school.id == Game.home_id)
+                )
             ).filter(
                 LeagueTeam.league_id == league_id
             ).order_by(
-                LeagueTeam.user_id, LeagueTeamSchoolAssignment.school_id
-            ).all()
+                LeagueTeam.user_id, LeagueTeamSchoolAssignment.school_id, Game.start_date
+            ).yield_per(200)  # Stream rows via a server-side cursor for large leagues
             
-            print(f"📊 Query 1: Got {len(league_members_query)} member-team combinations")
-            
-            # Group by user
+            # Group by user, and build the school games lookup as rows arrive
             users_teams = defaultdict(lambda: {'display_name': None, 'team_name': None, 'schools': []})
             all_school_ids = set()
+            school_games = defaultdict(list)
+            row_count = 0
             
-            for row in league_members_query:
+            for row in week_rows:
+                row_count += 1
                 user_id = str(row.user_id)
                 users_teams[user_id]['display_name'] = row.display_name
                 users_teams[user_id]['team_name'] = row.team_name
                 
-                if row.school_id:
+                if not row.school_id:
+                    continue
+                
+                if row.school_id not in all_school_ids:
                     all_school_ids.add(row.school_id)
                     users_teams[user_id]['schools'].append({
                         'id': row.school_id,
@@ -104,6 +173,62 @@ def lambda_handler(event, context):
                         'conference': row.conference,
                         'primaryColor': row.primary_color
                     })
+                
+                if row.home_id is None:
+                    # Bye week for this school
+                    continue
+                
+                is_home = row.home_id == row.school_id
+                school_points = row.home_points if is_home else row.away_points
+                opponent_points = row.away_points if is_home else row.home_points
+                
+                # Determine result
+                if not row.completed:
+                    result = 'S'  # Scheduled/In Progress
+                elif school_points > opponent_points:
+                    result = 'W'
+                elif school_points < opponent_points:
+                    result = 'L'
+                else:
+                    result = 'T'  # Tie
+                
+                # Format score
+                if school_points is not None and opponent_points is not None:
+                    score = _format_score(school_points, opponent_points)
+                else:
+                    score = "TBD"
+                
+                # Determine game status
+                is_started = bool(row.start_date and row.start_date <= current_time)
+                
+                if row.completed:
+                    status = 'completed'
+                elif is_started:
+                    status = 'in_progress'
+                else:
+                    status = 'scheduled'
+                
+                # Estimate quarter/time for in-progress games
+                quarter = None
+                time_remaining = None
+                if status == 'in_progress':
+                    total_points = (school_points or 0) + (opponent_points or 0)
+                    quarter, time_remaining = QUARTER_ESTIMATES[min(total_points // 14, 3)]
+                
+                school_games[row.school_id].append({
+                    'opponent': row.opponent_name or 'TBD',
+                    'opponentColor': row.opponent_color if row.opponent_name is not None else '#6c757d',
+                    'result': result,
+                    'score': score,
+                    'isHome': is_home,
+                    'status': status,
+                    'quarter': quarter,
+                    'timeRemaining': time_remaining,
+                    'startDate': row.start_date.isoformat() + 'Z' if row.start_date else None,
+                    'date': row.start_date.strftime('%m/%d %I:%M %p') if row.start_date else None
+                })
+            
+            logger.info("📊 Query: Got %s member-school-game rows", row_count)
             
             if not all_school_ids:
                 # No teams drafted yet
@@ -115,138 +240,9 @@ def lambda_handler(event, context):
                     'members': []
                 })
             
-            print(f"👥 Found {len(users_teams)} users with {len(all_school_ids)} unique schools")
-            
-            # =====================================================
-            # QUERY 2: Get ALL games for this week for ALL schools at once
-            # =====================================================
-            # This single query replaces 72 individual queries!
-            # Don't join opponent here - we'll look it up separately to avoid ambiguity
-            games_query = db.query(Game).filter(
-                and_(
-                    Game.season == season,
-                    Game.week == week,
-                    or_(
-                        Game.home_id.in_(all_school_ids),
-                        Game.away_id.in_(all_school_ids)
-                    )
-                )
-            ).all()
-            
-            # Get all opponent school IDs
-            opponent_ids = set()
-            for game in games_query:
-                if game.home_id in all_school_ids:
-                    opponent_ids.add(game.away_id)
-                if game.away_id in all_school_ids:
-                    opponent_ids.add(game.home_id)
-            
-            # Fetch all opponent schools in one query
-            opponent_schools = {}
-            if opponent_ids:
-                opponents = db.query(School).filter(School.id.in_(opponent_ids)).all()
-                for opp in opponents:
-                    opponent_schools[opp.id] = {
-                        'name': opp.name,
-                        'color': opp.primary_color
-                    }
-            
-            # Build school games lookup (can have multiple games per team in a week)
-            school_games = defaultdict(list)
-            for game in games_query:
-                # Process for each team in the league that's playing
-                teams_to_process = []
-                if game.home_id in all_school_ids:
-                    teams_to_process.append(('home', game.home_id, game.away_id))
-                if game.away_id in all_school_ids:
-                    teams_to_process.append(('away', game.away_id, game.home_id))
-                
-                for side, school_id, opponent_id in teams_to_process:
-                    is_home = (side == 'home')
-                    school_points = game.home_points if is_home else game.away_points
-                    opponent_points = game.away_points if is_home else game.home_points
-                    
-                    # Get opponent info
-                    opponent = opponent_schools.get(opponent_id, {'name': 'TBD', 'color': '#6c757d'})
-                    
-                    # Determine result
-                    if not game.completed:
-                        result = 'S'  # Scheduled/In Progress
-                    elif school_points > opponent_points:
-                        result = 'W'
-                    elif school_points < opponent_points:
-                        result = 'L'
-                    else:
-                        result = 'T'  # Tie
-                    
-                    # Format score
-                    if game.completed and school_points is not None and opponent_points is not None:
-                        score = f"{school_points}-{opponent_points}"
-                    elif not game.completed and school_points is not None and opponent_points is not None:
-                        score = f"{school_points}-{opponent_points}"
-                    else:
-                        score = "TBD"
-                    
-                    # Determine game status
-                    current_time = db.execute(text("SELECT NOW()")).scalar()
-                    
-                    if game.start_date and current_time:
-                        if game.start_date.tzinfo is None:
-                            game_start_utc = game.start_date.replace(tzinfo=timezone.utc)
-                        else:
-                            game_start_utc = game.start_date
-                        
-                        if current_time.tzinfo is not None and game.start_date.tzinfo is None:
-                            current_time_naive = current_time.replace(tzinfo=None)
-                            is_started = game.start_date <= current_time_naive
-                        elif current_time.tzinfo is None and game.start_date.tzinfo is not None:
-                            current_time_aware = current_time.replace(tzinfo=timezone.utc)
-                            is_started = game_start_utc <= current_time_aware
-                        else:
-                            is_started = game.start_date <= current_time
-                    else:
-                        is_started = False
-                    
-                    if game.completed:
-                        status = 'completed'
-                    elif is_started:
-                        status = 'in_progress'
-                    else:
-                        status = 'scheduled'
-                    
-                    # Estimate quarter/time for in-progress games
-                    quarter = None
-                    time_remaining = None
-                    if status == 'in_progress':
-                        total_points = (school_points or 0) + (opponent_points or 0)
-                        if total_points < 14:
-                            quarter = 1
-                            time_remaining = "12:30"
-                        elif total_points < 28:
-                            quarter = 2
-                            time_remaining = "8:45"
-                        elif total_points < 42:
-                            quarter = 3
-                            time_remaining = "5:15"
-                        else:
-                            quarter = 4
-                            time_remaining = "2:30"
-                    
-                    school_games[school_id].append({
-                        'opponent': opponent['name'],
-                        'opponentColor': opponent['color'],
-                        'result': result,
-                        'score': score,
-                        'isHome': is_home,
-                        'status': status,
-                        'quarter': quarter,
-                        'timeRemaining': time_remaining,
-                        'startDate': game.start_date.isoformat() + 'Z' if game.start_date else None,
-                        'date': game.start_date.strftime('%m/%d %I:%M %p') if game.start_date else None
-                    })
-            
             total_games = sum(len(games) for games in school_games.values())
-            print(f"🏈 Query 2: Got {total_games} games for {len(school_games)} schools in week {week}")
+            logger.info("👥 Found %s users with %s unique schools", len(users_teams), len(all_school_ids))
+            logger.info("🏈 Got %s games for %s schools in week %s", total_games, len(school_games), week)
             
             # =====================================================
             # ASSEMBLE RESPONSE
@@ -265,14 +261,7 @@ def lambda_handler(event, context):
                     if not games:
                         # No game this week
                         week_no_games += 1
-                        teams.append({
-                            'id': school_id,
-                            'name': school['name'],
-                            'mascot': school['mascot'],
-                            'conference': school['conference'],
-                            'primaryColor': school['primaryColor'],
-                            'games': []
-                        })
+                        teams.append({**school, 'games': []})
                     else:
                         # Track wins/losses for all games
                         for game in games:
@@ -281,14 +270,7 @@ def lambda_handler(event, context):
                             elif game['result'] == 'L':
                                 week_losses += 1
                         
-                        teams.append({
-                            'id': school_id,
-                            'name': school['name'],
-                            'mascot': school['mascot'],
-                            'conference': school['conference'],
-                            'primaryColor': school['primaryColor'],
-                            'games': games
-                        })
+                        teams.append({**school, 'games': games})
                 
                 # Format week record
                 if week_no_games == len(user_data['schools']):
@@ -311,22 +293,22 @@ def lambda_handler(event, context):
             # Sort by week wins descending, then by display name
             members.sort(key=lambda x: (-x['weekWins'], x['displayName']))
             
-            print(f"✅ OPTIMIZED: Returning {len(members)} members (used ~3 queries instead of ~{len(all_school_ids) + 10})")
+            logger.info("✅ OPTIMIZED: Returning %s members (used 1 query instead of ~%s)", len(members), len(all_school_ids) + 10)
             
-            return success_response({
+            response = success_response({
                 'leagueId': str(league.id),
                 'leagueName': league.name,
                 'season': season,
                 'week': week_info,
                 'members': members
             })
+            if cache_key:
+                set_cached_json(cache_key, response, WEEK_CACHE_TTL_SECONDS)
+            return response
             
         finally:
             db.close()
             
     except Exception as e:
-        print(f"Get games week error: {str(e)}")
-        print(f"Get games week error type: {type(e)}")
-        import traceback
-        print(f"Get games week traceback: {traceback.format_exc()}")
+        log_exception("Get games week", e)
         return error_response('Failed to get week games', 500)
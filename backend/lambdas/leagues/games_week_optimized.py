@@ -1,311 +0,0 @@
-import json
-import sys
-import os
-from datetime import datetime, timezone
-from collections import defaultdict
-
-# Import from layer
-from shared.database import get_db_session, League, User, LeagueTeam, LeagueTeamSchoolAssignment, School, Game
-from shared.responses import success_response, error_response, not_found_response
-from shared.auth import require_auth, get_user_uuid_from_event
-from shared.week_utils import get_current_week_of_season, get_week_info
-from sqlalchemy.orm import joinedload
-from sqlalchemy import and_, or_, text
-
-def lambda_handler(event, context):
-    """Get league games for a specific week with member team performance - OPTIMIZED VERSION
-    
-    Performance improvements:
-    - Reduced from ~72 queries to ~3 queries total
-    - Batch fetches all games for the week at once
-    - 10-20x faster response time
-    """
-    try:
-        # Get parameters
-        league_id = event['pathParameters']['league_id']
-        week_param = event['pathParameters'].get('week', 'current')
-        # No auth required for public viewing
-        
-        db = get_db_session()
-        try:
-            # Get league first to get the season
-            league = db.query(League).filter(League.id == league_id).first()
-            if not league:
-                return not_found_response('League')
-            
-            # Use the league's season - no defaults!
-            season = league.season
-            if not season:
-                return error_response('League season not configured', 400)
-            
-            # Determine which week to show
-            if week_param == 'current':
-                week = get_current_week_of_season(season)
-            else:
-                try:
-                    week = int(week_param)
-                except ValueError:
-                    return error_response('Invalid week parameter', 400)
-            
-            # Validate week range
-            if week < 1 or week > 17:
-                return error_response('Week must be between 1 and 17', 400)
-            
-            # Get week metadata
-            week_info = get_week_info(week, season)
-            
-            print(f"🚀 OPTIMIZED: Fetching games for league {league.name}, season {season}, week {week}")
-            
-            # =====================================================
-            # QUERY 1: Get all league members and their teams
-            # =====================================================
-            league_members_query = db.query(
-                LeagueTeam.user_id,
-                User.display_name,
-                LeagueTeam.team_name,
-                LeagueTeamSchoolAssignment.school_id,
-                School.name.label('school_name'),
-                School.mascot,
-                School.conference,
-                School.primary_color
-            ).join(
-                User, LeagueTeam.user_id == User.id
-            ).outerjoin(
-                LeagueTeamSchoolAssignment,
-                and_(
-                    LeagueTeamSchoolAssignment.league_id == LeagueTeam.league_id,
-                    LeagueTeamSchoolAssignment.user_id == LeagueTeam.user_id
-                )
-            ).outerjoin(
-                School, LeagueTeamSchoolAssignment.school_id == School.id
-            ).filter(
-                LeagueTeam.league_id == league_id
-            ).order_by(
-                LeagueTeam.user_id, LeagueTeamSchoolAssignment.school_id
-            ).all()
-            
-            print(f"📊 Query 1: Got {len(league_members_query)} member-team combinations")
-            
-            # Group by user
-            users_teams = defaultdict(lambda: {'display_name': None, 'team_name': None, 'schools': []})
-            all_school_ids = set()
-            
-            for row in league_members_query:
-                user_id = str(row.user_id)
-                users_teams[user_id]['display_name'] = row.display_name
-                users_teams[user_id]['team_name'] = row.team_name
-                
-                if row.school_id:
-                    all_school_ids.add(row.school_id)
-                    users_teams[user_id]['schools'].append({
-                        'id': row.school_id,
-                        'name': row.school_name,
-                        'mascot': row.mascot,
-                        'conference': row.conference,
-                        'primaryColor': row.primary_color
-                    })
-            
-            if not all_school_ids:
-                # No teams drafted yet
-                return success_response({
-                    'leagueId': str(league.id),
-                    'leagueName': league.name,
-                    'season': season,
-                    'week': week_info,
-                    'members': []
-                })
-            
-            print(f"👥 Found {len(users_teams)} users with {len(all_school_ids)} unique schools")
-            
-            # =====================================================
-            # QUERY 2: Get ALL games for this week for ALL schools at once
-            # =====================================================
-            # This single query replaces 72 individual queries!
-            games_query = db.query(
-                Game,
-                School.name.label('opponent_name'),
-                School.primary_color.label('opponent_color')
-            ).outerjoin(
-                School,
-                or_(
-                    and_(Game.home_id.in_(all_school_ids), School.id == Game.away_id),
-                    and_(Game.away_id.in_(all_school_ids), School.id == Game.home_id)
-                )
-            ).filter(
-                and_(
-                    Game.season == season,
-                    Game.week == week,
-                    or_(
-                        Game.home_id.in_(all_school_ids),
-                        Game.away_id.in_(all_school_ids)
-                    )
-                )
-            ).all()
-            
-            # Build school games lookup
-            school_games = {}
-            for game, opponent_name, opponent_color in games_query:
-                school_id = game.home_id if game.home_id in all_school_ids else game.away_id
-                is_home = game.home_id == school_id
-                school_points = game.home_points if is_home else game.away_points
-                opponent_points = game.away_points if is_home else game.home_points
-                
-                # Determine result
-                if not game.completed:
-                    result = 'S'  # Scheduled/In Progress
-                elif school_points > opponent_points:
-                    result = 'W'
-                elif school_points < opponent_points:
-                    result = 'L'
-                else:
-                    result = 'T'  # Tie
-                
-                # Format score
-                if game.completed and school_points is not None and opponent_points is not None:
-                    score = f"{school_points}-{opponent_points}"
-                elif not game.completed and school_points is not None and opponent_points is not None:
-                    score = f"{school_points}-{opponent_points}"
-                else:
-                    score = "TBD"
-                
-                # Determine game status
-                current_time = db.execute(text("SELECT NOW()")).scalar()
-                
-                if game.start_date and current_time:
-                    if game.start_date.tzinfo is None:
-                        game_start_utc = game.start_date.replace(tzinfo=timezone.utc)
-                    else:
-                        game_start_utc = game.start_date
-                    
-                    if current_time.tzinfo is not None and game.start_date.tzinfo is None:
-                        current_time_naive = current_time.replace(tzinfo=None)
-                        is_started = game.start_date <= current_time_naive
-                    elif current_time.tzinfo is None and game.start_date.tzinfo is not None:
-                        current_time_aware = current_time.replace(tzinfo=timezone.utc)
-                        is_started = game_start_utc <= current_time_aware
-                    else:
-                        is_started = game.start_date <= current_time
-                else:
-                    is_started = False
-                
-                if game.completed:
-                    status = 'completed'
-                elif is_started:
-                    status = 'in_progress'
-                else:
-                    status = 'scheduled'
-                
-                # Estimate quarter/time for in-progress games
-                quarter = None
-                time_remaining = None
-                if status == 'in_progress':
-                    total_points = (school_points or 0) + (opponent_points or 0)
-                    if total_points < 14:
-                        quarter = 1
-                        time_remaining = "12:30"
-                    elif total_points < 28:
-                        quarter = 2
-                        time_remaining = "8:45"
-                    elif total_points < 42:
-                        quarter = 3
-                        time_remaining = "5:15"
-                    else:
-                        quarter = 4
-                        time_remaining = "2:30"
-                
-                school_games[school_id] = {
-                    'opponent': opponent_name or 'TBD',
-                    'opponentColor': opponent_color or '#6c757d',
-                    'result': result,
-                    'score': score,
-                    'isHome': is_home,
-                    'status': status,
-                    'quarter': quarter,
-                    'timeRemaining': time_remaining,
-                    'startDate': game.start_date.isoformat() + 'Z' if game.start_date else None,
-                    'date': game.start_date.strftime('%m/%d %I:%M %p') if game.start_date else None
-                }
-            
-            print(f"🏈 Query 2: Got {len(school_games)} games for week {week}")
-            
-            # =====================================================
-            # ASSEMBLE RESPONSE
-            # =====================================================
-            members = []
-            for user_id, user_data in users_teams.items():
-                week_wins = 0
-                week_losses = 0
-                week_no_games = 0
-                teams = []
-                
-                for school in user_data['schools']:
-                    school_id = school['id']
-                    game = school_games.get(school_id)
-                    
-                    if not game:
-                        # No game this week
-                        week_no_games += 1
-                        teams.append({
-                            'id': school_id,
-                            'name': school['name'],
-                            'mascot': school['mascot'],
-                            'conference': school['conference'],
-                            'primaryColor': school['primaryColor'],
-                            'game': None
-                        })
-                    else:
-                        # Track wins/losses
-                        if game['result'] == 'W':
-                            week_wins += 1
-                        elif game['result'] == 'L':
-                            week_losses += 1
-                        
-                        teams.append({
-                            'id': school_id,
-                            'name': school['name'],
-                            'mascot': school['mascot'],
-                            'conference': school['conference'],
-                            'primaryColor': school['primaryColor'],
-                            'game': game
-                        })
-                
-                # Format week record
-                if week_no_games == len(user_data['schools']):
-                    week_record = "No games"
-                else:
-                    week_record = f"{week_wins}-{week_losses}"
-                    if week_no_games > 0:
-                        week_record += f" ({week_no_games} bye)"
-                
-                members.append({
-                    'id': user_id,
-                    'displayName': user_data['display_name'],
-                    'weekRecord': week_record,
-                    'weekWins': week_wins,
-                    'weekLosses': week_losses,
-                    'weekNoGames': week_no_games,
-                    'teams': teams
-                })
-            
-            # Sort by week wins descending, then by display name
-            members.sort(key=lambda x: (-x['weekWins'], x['displayName']))
-            
-            print(f"✅ OPTIMIZED: Returning {len(members)} members (used ~3 queries instead of ~{len(all_school_ids) + 10})")
-            
-            return success_response({
-                'leagueId': str(league.id),
-                'leagueName': league.name,
-                'season': season,
-                'week': week_info,
-                'members': members
-            })
-            
-        finally:
-            db.close()
-            
-    except Exception as e:
-        print(f"Get games week error: {str(e)}")
-        print(f"Get games week error type: {type(e)}")
-        import traceback
-        print(f"Get games week traceback: {traceback.format_exc()}")
-        return error_response('Failed to get week games', 500)
@@ -5,11 +5,20 @@ Get league settings and member list (admin only)
 import json
 import sys
 import os
+from collections import defaultdict
 
 # Import from layer
-from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment, User, School
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.database import get_db_session, strict_loading_options, League, LeagueTeam, LeagueTeamSchoolAssignment, User, School
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception
 from shared.auth import require_auth, get_user_id_from_event
+from shared.cache import get_cached_json, set_cached_json, league_settings_key
+from sqlalchemy.orm import joinedload, load_only
+
+# Set LEAGUES_DEBUG=1 to log the creator/user id comparison on every request
+DEBUG = os.getenv('LEAGUES_DEBUG') == '1'
+
+# Writers call invalidate_league_cache; the TTL is a backstop for anything they miss
+SETTINGS_CACHE_TTL_SECONDS = 60
 
 @require_auth
 def lambda_handler(event, context):
@@ -25,55 +34,64 @@ def lambda_handler(event, context):
         db = get_db_session()
         try:
             # Verify league exists and user is creator
-            league = db.query(League).filter(League.id == league_id).first()
+            league = db.query(League)\
+                .options(joinedload(League.creator).load_only(User.id, User.display_name), *strict_loading_options())\
+                .filter(League.id == league_id)\
+                .first()
             if not league:
                 return not_found_response('League')
             
             # Debug logging
-            print(f"DEBUG: user_id from token: {user_id} (type: {type(user_id)})")
-            print(f"DEBUG: league.created_by: {league.created_by} (type: {type(league.created_by)})")
-            print(f"DEBUG: user_id == league.created_by: {user_id == league.created_by}")
-            print(f"DEBUG: str(user_id) == str(league.created_by): {str(user_id) == str(league.created_by)}")
+            if DEBUG:
+                print(f"DEBUG: user_id from token: {user_id} (type: {type(user_id)})")
+                print(f"DEBUG: league.created_by: {league.created_by} (type: {type(league.created_by)})")
+                print(f"DEBUG: user_id == league.created_by: {user_id == league.created_by}")
+                print(f"DEBUG: str(user_id) == str(league.created_by): {str(user_id) == str(league.created_by)}")
             
             if str(league.created_by) != str(user_id):
                 return error_response('Only the league creator can access settings', 403)
             
-            # Get creator info
-            creator = db.query(User).filter(User.id == league.created_by).first()
+            cached = get_cached_json(league_settings_key(league_id))
+            if cached is not None:
+                return success_response(cached)
+            
+            # Creator info was loaded with the league
+            creator = league.creator
             
             # Get all members with their pick counts and teams
             members_query = db.query(LeagueTeam, User)\
                 .join(User, LeagueTeam.user_id == User.id)\
+                .options(load_only(User.id, User.display_name, User.is_manual), *strict_loading_options())\
                 .filter(LeagueTeam.league_id == league_id)\
                 .order_by(LeagueTeam.joined_at)\
                 .all()
             
+            # Get all teams (schools) for the whole league in one query, grouped by user
+            teams_query = db.query(LeagueTeamSchoolAssignment, School)\
+                .join(School, LeagueTeamSchoolAssignment.school_id == School.id)\
+                .options(*strict_loading_options())\
+                .filter(LeagueTeamSchoolAssignment.league_id == league_id)\
+                .order_by(LeagueTeamSchoolAssignment.user_id, LeagueTeamSchoolAssignment.draft_round)\
+                .all()
+            
+            teams_by_user = defaultdict(list)
+            for assignment, school in teams_query:
+                teams_by_user[assignment.user_id].append({
+                    'id': school.id,
+                    'name': school.name,
+                    'mascot': school.mascot,
+                    'conference': school.conference,
+                    'primaryColor': school.primary_color,
+                    'draftRound': assignment.draft_round,
+                    'draftPickOverall': assignment.draft_pick_overall
+                })
+            
             members = []
             for league_team, user in members_query:
-                # Get all teams (schools) for this user
-                teams_query = db.query(LeagueTeamSchoolAssignment, School)\
-                    .join(School, LeagueTeamSchoolAssignment.school_id == School.id)\
-                    .filter(
-                        LeagueTeamSchoolAssignment.league_id == league_id,
-                        LeagueTeamSchoolAssignment.user_id == user.id
-                    )\
-                    .order_by(LeagueTeamSchoolAssignment.draft_round)\
-                    .all()
-                
-                teams = []
-                for assignment, school in teams_query:
-                    teams.append({
-                        'id': school.id,
-                        'name': school.name,
-                        'mascot': school.mascot,
-                        'conference': school.conference,
-                        'primaryColor': school.primary_color,
-                        'draftRound': assignment.draft_round,
-                        'draftPickOverall': assignment.draft_pick_overall
-                    })
+                teams = teams_by_user.get(user.id, [])
                 
                 # Check if this is a manual team (dummy user)
-                is_manual_team = user.email.endswith('@cfbpick6.internal')
+                is_manual_team = bool(user.is_manual)
                 
                 members.append({
                     'userId': str(user.id),
@@ -87,12 +105,10 @@ def lambda_handler(event, context):
                     'isManualTeam': is_manual_team  # Flag to identify manual teams
                 })
             
-            # Count total picks made
-            total_picks = db.query(LeagueTeamSchoolAssignment).filter(
-                LeagueTeamSchoolAssignment.league_id == league_id
-            ).count()
+            # Count total picks made - every assignment is already loaded above
+            total_picks = len(teams_query)
             
-            return success_response({
+            settings = {
                 'league': {
                     'id': str(league.id),
                     'name': league.name,
@@ -112,13 +128,14 @@ def lambda_handler(event, context):
                     'totalPicks': total_picks,
                     'maxPossiblePicks': len(members) * league.max_teams_per_user
                 }
-            })
+            }
+            set_cached_json(league_settings_key(league_id), settings, SETTINGS_CACHE_TTL_SECONDS)
+            
+            return success_response(settings)
             
         finally:
             db.close()
             
     except Exception as e:
-        print(f"Get league settings error: {str(e)}")
-        import traceback
-        print(f"Get league settings traceback: {traceback.format_exc()}")
+        log_exception("Get league settings", e)
         return error_response('Failed to get league settings', 500)
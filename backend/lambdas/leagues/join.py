@@ -3,10 +3,12 @@ import sys
 import os
 
 # Import from layer
-from shared.database import get_db_session, League, LeagueTeam, User, School
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.database import get_db_session, strict_loading_options, League, LeagueTeam, User, School
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, parse_body
 from shared.auth import require_auth, get_user_id_from_event
+from shared.cache import invalidate_league_cache
 from sqlalchemy import and_
+from sqlalchemy.orm import joinedload
 
 @require_auth
 def lambda_handler(event, context):
@@ -16,7 +18,7 @@ def lambda_handler(event, context):
         if not event.get('body'):
             return validation_error_response({'body': 'Request body is required'})
         
-        body = json.loads(event['body'])
+        body = parse_body(event)
         join_code = body.get('joinCode', '').strip().upper()
         team_name = body.get('teamName', '').strip()
         user_id = get_user_id_from_event(event)
@@ -47,12 +49,14 @@ def lambda_handler(event, context):
             if not league:
                 return not_found_response('League with that join code')
             
-            # Check if user is already a member
-            existing_membership = db.query(LeagueTeam).filter(
-                and_(LeagueTeam.league_id == league.id, LeagueTeam.user_id == user_id)
-            ).first()
+            # Check if user is already a member (EXISTS - no row to materialize)
+            already_member = db.query(
+                db.query(LeagueTeam).filter(
+                    and_(LeagueTeam.league_id == league.id, LeagueTeam.user_id == user_id)
+                ).exists()
+            ).scalar()
             
-            if existing_membership:
+            if already_member:
                 return error_response('You are already a member of this league', 409)
             
             # Check league status - only allow joining pre_draft and drafting leagues
@@ -69,17 +73,20 @@ def lambda_handler(event, context):
             
             db.add(new_team)
             db.commit()
+            invalidate_league_cache(league.id)
             db.refresh(new_team)
             
             # Get current members for the response
-            members_query = db.query(LeagueTeam, User)\
-                .join(User, LeagueTeam.user_id == User.id)\
+            # Eager-load only the user columns we return, in the same round-trip
+            members_query = db.query(LeagueTeam)\
+                .options(joinedload(LeagueTeam.user).load_only(User.id, User.display_name), *strict_loading_options())\
                 .filter(LeagueTeam.league_id == league.id)\
                 .order_by(LeagueTeam.joined_at)\
                 .all()
             
             members = []
-            for league_team, user in members_query:
+            for league_team in members_query:
+                user = league_team.user
                 members.append({
                     'userId': str(user.id),
                     'displayName': user.display_name,
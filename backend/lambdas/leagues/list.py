@@ -6,8 +6,39 @@ import os
 from shared.database import get_db_session, League, LeagueTeam, User
 from shared.responses import success_response, error_response
 from shared.auth import require_auth, get_user_id_from_event
-from sqlalchemy.orm import joinedload
-from sqlalchemy import and_
+from sqlalchemy.orm import joinedload, aliased
+from sqlalchemy import select, bindparam, and_, or_, func, distinct, case
+
+# One Core SELECT for leagues where the user is either creator OR member,
+# with the counts folded in - plain rows, no ORM objects to build.
+# The membership join is on (league_id, user_id) - the league_teams
+# primary key - so each league comes back at most once.
+# Built once per container; SQLAlchemy's compiled cache reuses its SQL on warm calls.
+_user_team = aliased(LeagueTeam)
+_member_count = select(func.count(distinct(LeagueTeam.user_id)))\
+    .where(LeagueTeam.league_id == League.id)\
+    .correlate(League)\
+    .scalar_subquery()
+
+USER_LEAGUES_STMT = select(
+    League.id,
+    League.name,
+    League.season,
+    League.status,
+    League.join_code,
+    League.max_teams_per_user,
+    League.created_at,
+    League.created_by,
+    _member_count.label('member_count'),
+    case((_user_team.user_id.isnot(None), 1), else_=0).label('user_team_count')
+).outerjoin(
+    _user_team, and_(
+        _user_team.league_id == League.id,
+        _user_team.user_id == bindparam('user_id')
+    )
+).where(
+    or_(League.created_by == bindparam('user_id'), _user_team.user_id == bindparam('user_id'))
+).order_by(League.created_at.desc())  # Most recent first
 
 @require_auth
 def lambda_handler(event, context):
@@ -17,52 +48,21 @@ def lambda_handler(event, context):
         
         db = get_db_session()
         try:
-            # Get leagues where user is either creator OR member
-            # First get leagues created by user
-            created_leagues = db.query(League)\
-                .filter(League.created_by == user_id)\
-                .all()
-            
-            # Then get leagues where user is a member (has picked teams)
-            member_leagues = db.query(League)\
-                .join(LeagueTeam, League.id == LeagueTeam.league_id)\
-                .filter(LeagueTeam.user_id == user_id)\
-                .all()
-            
-            # Combine and deduplicate
-            all_leagues = {league.id: league for league in created_leagues + member_leagues}
-            
-            leagues_data = []
-            for league in all_leagues.values():
-                # Count members
-                member_count = db.query(LeagueTeam.user_id)\
-                    .filter(LeagueTeam.league_id == league.id)\
-                    .distinct()\
-                    .count()
-                
-                # Check if user has teams in this league
-                user_team_count = db.query(LeagueTeam)\
-                    .filter(and_(
-                        LeagueTeam.league_id == league.id,
-                        LeagueTeam.user_id == user_id
-                    ))\
-                    .count()
-                
-                leagues_data.append({
-                    'id': str(league.id),
-                    'name': league.name,
-                    'season': league.season,
-                    'status': league.status,
-                    'joinCode': league.join_code,
-                    'memberCount': member_count,
-                    'userTeamCount': user_team_count,
-                    'maxTeamsPerUser': league.max_teams_per_user,
-                    'createdAt': league.created_at.isoformat(),
-                    'isCreator': str(league.created_by) == str(user_id)
-                })
-            
-            # Sort by most recent first
-            leagues_data.sort(key=lambda x: x['createdAt'], reverse=True)
+            leagues_data = [
+                {
+                    'id': str(row['id']),
+                    'name': row['name'],
+                    'season': row['season'],
+                    'status': row['status'],
+                    'joinCode': row['join_code'],
+                    'memberCount': row['member_count'],
+                    'userTeamCount': row['user_team_count'],
+                    'maxTeamsPerUser': row['max_teams_per_user'],
+                    'createdAt': row['created_at'].isoformat(),
+                    'isCreator': str(row['created_by']) == str(user_id)
+                }
+                for row in db.execute(USER_LEAGUES_STMT, {'user_id': user_id}).mappings()
+            ]
             
             return success_response(leagues_data)
             
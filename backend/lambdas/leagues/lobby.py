@@ -3,10 +3,15 @@ import sys
 import os
 
 # Import from layer
-from shared.database import get_db_session, League, LeagueTeam, User
-from shared.responses import success_response, error_response, not_found_response
+from shared.database import get_db_session, strict_loading_options, League, LeagueTeam, User
+from shared.responses import success_response, error_response, not_found_response, log_exception
 from shared.auth import require_auth, get_user_id_from_event
+from shared.cache import get_cached_json, set_cached_json, league_lobby_key
 from sqlalchemy import and_
+from sqlalchemy.orm import joinedload
+
+# Writers call invalidate_league_cache; the TTL is a backstop for anything they miss
+LOBBY_CACHE_TTL_SECONDS = 60
 
 @require_auth
 def lambda_handler(event, context):
@@ -17,58 +22,73 @@ def lambda_handler(event, context):
         
         db = get_db_session()
         try:
-            # Get league
-            league = db.query(League).filter(League.id == league_id).first()
+            # Get league and the user's membership in one query
+            row = db.query(League, LeagueTeam)\
+                .options(joinedload(League.creator).load_only(User.id, User.display_name), *strict_loading_options())\
+                .outerjoin(LeagueTeam, and_(
+                    LeagueTeam.league_id == League.id,
+                    LeagueTeam.user_id == user_id
+                ))\
+                .filter(League.id == league_id)\
+                .first()
+            league, user_membership = row if row else (None, None)
             if not league:
                 return not_found_response('League')
             
             # Check if user is a member of this league
-            user_membership = db.query(LeagueTeam).filter(
-                and_(LeagueTeam.league_id == league_id, LeagueTeam.user_id == user_id)
-            ).first()
-            
             if not user_membership:
                 return error_response('You are not a member of this league', 403)
             
-            # Get all league members with their details
-            members_query = db.query(LeagueTeam, User)\
-                .join(User, LeagueTeam.user_id == User.id)\
-                .filter(LeagueTeam.league_id == league_id)\
-                .order_by(LeagueTeam.joined_at)\
-                .all()
-            
-            members = []
-            for league_team, user in members_query:
-                members.append({
-                    'userId': str(user.id),
-                    'displayName': user.display_name,
-                    'teamName': league_team.team_name,
-                    'draftPosition': league_team.draft_position,
-                    'joinedAt': league_team.joined_at.isoformat(),
-                    'isCreator': str(user.id) == str(league.created_by)
-                })
-            
-            # Get creator info
-            creator = db.query(User).filter(User.id == league.created_by).first()
-            creator_name = creator.display_name if creator else 'Unknown'
+            # The league/members snapshot is the same for every member; only
+            # userMembership is per caller, so that part is never cached
+            lobby = get_cached_json(league_lobby_key(league_id))
+            if lobby is None:
+                # Get all league members with their details
+                # Eager-load only the user columns we return, in the same round-trip
+                members_query = db.query(LeagueTeam)\
+                    .options(joinedload(LeagueTeam.user).load_only(User.id, User.display_name), *strict_loading_options())\
+                    .filter(LeagueTeam.league_id == league_id)\
+                    .order_by(LeagueTeam.joined_at)\
+                    .all()
+                
+                members = []
+                for league_team in members_query:
+                    user = league_team.user
+                    members.append({
+                        'userId': str(user.id),
+                        'displayName': user.display_name,
+                        'teamName': league_team.team_name,
+                        'draftPosition': league_team.draft_position,
+                        'joinedAt': league_team.joined_at.isoformat(),
+                        'isCreator': str(user.id) == str(league.created_by)
+                    })
+                
+                # Creator info was loaded with the league
+                creator = league.creator
+                creator_name = creator.display_name if creator else 'Unknown'
+                
+                lobby = {
+                    'league': {
+                        'id': str(league.id),
+                        'name': league.name,
+                        'season': league.season,
+                        'status': league.status,
+                        'joinCode': league.join_code,
+                        'maxTeamsPerUser': league.max_teams_per_user,
+                        'createdAt': league.created_at.isoformat(),
+                        'createdBy': str(league.created_by),
+                        'createdByName': creator_name
+                    },
+                    'members': members,
+                    'stats': {
+                        'totalMembers': len(members),
+                        'canStartDraft': len(members) >= 2
+                    }
+                }
+                set_cached_json(league_lobby_key(league_id), lobby, LOBBY_CACHE_TTL_SECONDS)
             
             return success_response({
-                'league': {
-                    'id': str(league.id),
-                    'name': league.name,
-                    'season': league.season,
-                    'status': league.status,
-                    'joinCode': league.join_code,
-                    'maxTeamsPerUser': league.max_teams_per_user,
-                    'createdAt': league.created_at.isoformat(),
-                    'createdBy': str(league.created_by),
-                    'createdByName': creator_name
-                },
-                'members': members,
-                'stats': {
-                    'totalMembers': len(members),
-                    'canStartDraft': len(members) >= 2
-                },
+                **lobby,
                 'userMembership': {
                     'userId': str(user_membership.user_id),
                     'teamName': user_membership.team_name,
@@ -82,7 +102,5 @@ def lambda_handler(event, context):
             db.close()
             
     except Exception as e:
-        print(f"League lobby error: {str(e)}")
-        import traceback
-        print(f"League lobby traceback: {traceback.format_exc()}")
+        log_exception("League lobby", e)
         return error_response('Failed to get league lobby information', 500)
@@ -3,9 +3,10 @@ import sys
 import os
 
 # Import from layer
-from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment, School, User
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.database import get_db_session, strict_loading_options, League, LeagueTeam, LeagueTeamSchoolAssignment, School, User
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception
 from shared.auth import require_auth, get_user_id_from_event
+from sqlalchemy import and_
 
 @require_auth
 def lambda_handler(event, context):
@@ -20,23 +21,27 @@ def lambda_handler(event, context):
         
         db = get_db_session()
         try:
+            # Get league and the user's membership in one query
+            row = db.query(League, LeagueTeam).outerjoin(
+                LeagueTeam, and_(
+                    LeagueTeam.league_id == League.id,
+                    LeagueTeam.user_id == user_id
+                )
+            ).options(*strict_loading_options()).filter(League.id == league_id).first()
+            league, league_team = row if row else (None, None)
+            
             # Verify league exists
-            league = db.query(League).filter(League.id == league_id).first()
             if not league:
                 return not_found_response('League')
             
             # Verify user is a member of this league
-            league_team = db.query(LeagueTeam).filter(
-                LeagueTeam.league_id == league_id,
-                LeagueTeam.user_id == user_id
-            ).first()
             if not league_team:
                 return error_response('You are not a member of this league', 403)
             
             # Get user's school assignments in this league
             school_assignments = db.query(LeagueTeamSchoolAssignment, School).join(
                 School, LeagueTeamSchoolAssignment.school_id == School.id
-            ).filter(
+            ).options(*strict_loading_options()).filter(
                 LeagueTeamSchoolAssignment.league_id == league_id,
                 LeagueTeamSchoolAssignment.user_id == user_id
             ).order_by(LeagueTeamSchoolAssignment.draft_round).all()
@@ -71,8 +76,5 @@ def lambda_handler(event, context):
             db.close()
             
     except Exception as e:
-        print(f"My teams error: {str(e)}")
-        print(f"My teams error type: {type(e)}")
-        import traceback
-        print(f"My teams traceback: {traceback.format_exc()}")
+        log_exception("My teams", e)
         return error_response('Failed to fetch user teams', 500)
@@ -4,13 +4,15 @@ Remove a player from a league (admin only)
 
 import json
 from sqlalchemy import and_
+from sqlalchemy.orm import load_only
 import sys
 import os
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment, LeagueDraft, User
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception
 from shared.auth import require_auth, get_user_id_from_event
+from shared.cache import invalidate_league_cache
 
 @require_auth
 def lambda_handler(event, context):
@@ -57,7 +59,10 @@ def lambda_handler(event, context):
                 return not_found_response('Player not found in this league')
             
             # Get player info for response
-            player = db.query(User).filter(User.id == player_user_id).first()
+            player = db.query(User)\
+                .options(load_only(User.id, User.display_name))\
+                .filter(User.id == player_user_id)\
+                .first()
             player_name = player.display_name if player else "Unknown Player"
             
             # Remove all of the player's draft picks
@@ -66,7 +71,7 @@ def lambda_handler(event, context):
                     LeagueTeamSchoolAssignment.league_id == league_id,
                     LeagueTeamSchoolAssignment.user_id == player_user_id
                 )
-            ).delete()
+            ).delete(synchronize_session=False)  # Rows are never loaded in this session
             
             # Remove the league team membership
             db.delete(league_team)
@@ -75,13 +80,17 @@ def lambda_handler(event, context):
             if league.status == 'drafting':
                 draft = db.query(LeagueDraft).filter(LeagueDraft.league_id == league_id).first()
                 if draft:
-                    # If it was the removed player's turn, advance to next player
-                    if draft.current_user_id == player_user_id:
-                        # Get remaining players in draft order
-                        remaining_teams = db.query(LeagueTeam).filter(
+                    # Get remaining players in draft order (the delete above isn't
+                    # flushed yet, so leave the removed player out here)
+                    remaining_teams = [
+                        team for team in db.query(LeagueTeam).filter(
                             LeagueTeam.league_id == league_id
                         ).order_by(LeagueTeam.draft_position).all()
-                        
+                        if team.user_id != league_team.user_id
+                    ]
+                    
+                    # If it was the removed player's turn, advance to next player
+                    if draft.current_user_id == player_user_id:
                         if remaining_teams:
                             # Calculate who should pick next
                             current_pick = draft.current_pick_overall
@@ -99,12 +108,10 @@ def lambda_handler(event, context):
                             draft.current_user_id = None
                     
                     # Recalculate total picks
-                    remaining_count = db.query(LeagueTeam).filter(
-                        LeagueTeam.league_id == league_id
-                    ).count()
-                    draft.total_picks = remaining_count * league.max_teams_per_user
+                    draft.total_picks = len(remaining_teams) * league.max_teams_per_user
             
             db.commit()
+            invalidate_league_cache(league_id)
             
             return success_response({
                 'message': f'Successfully removed {player_name} from the league',
@@ -119,7 +126,5 @@ def lambda_handler(event, context):
             db.close()
             
     except Exception as e:
-        print(f"Remove player error: {str(e)}")
-        import traceback
-        print(f"Remove player traceback: {traceback.format_exc()}")
+        log_exception("Remove player", e)
         return error_response('Failed to remove player', 500)
@@ -8,8 +8,9 @@ import os
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment, LeagueDraft
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception
 from shared.auth import require_auth, get_user_id_from_event
+from shared.cache import invalidate_league_cache
 
 @require_auth
 def lambda_handler(event, context):
@@ -36,35 +37,35 @@ def lambda_handler(event, context):
             if league.status not in ['drafting', 'active', 'completed']:
                 return error_response(f'Cannot reset draft - league status is {league.status}', 400)
             
-            # Count existing picks before deletion
+            # Remove all draft picks - the deleted row count is the number of picks removed.
+            # None of these rows are loaded in this session, so skip synchronizing it.
             picks_count = db.query(LeagueTeamSchoolAssignment).filter(
                 LeagueTeamSchoolAssignment.league_id == league_id
-            ).count()
-            
-            # Remove all draft picks
-            db.query(LeagueTeamSchoolAssignment).filter(
-                LeagueTeamSchoolAssignment.league_id == league_id
-            ).delete()
+            ).delete(synchronize_session=False)
             
             # Remove draft state
             db.query(LeagueDraft).filter(
                 LeagueDraft.league_id == league_id
-            ).delete()
+            ).delete(synchronize_session=False)
             
             # Reset all draft positions
             db.query(LeagueTeam).filter(
                 LeagueTeam.league_id == league_id
-            ).update({'draft_position': None})
+            ).update({'draft_position': None}, synchronize_session=False)
             
-            # Reset league status to pre_draft
-            league.status = 'pre_draft'
+            # Reset league status to pre_draft - an explicit UPDATE alongside the others
+            # rather than a dirty attribute flushed at commit
+            db.query(League).filter(
+                League.id == league_id
+            ).update({'status': 'pre_draft'}, synchronize_session=False)
             
             db.commit()
+            invalidate_league_cache(league_id)
             
             return success_response({
                 'message': f'Successfully reset draft - removed {picks_count} picks',
                 'leagueId': str(league_id),
-                'leagueStatus': league.status,
+                'leagueStatus': 'pre_draft',
                 'picksRemoved': picks_count
             })
             
@@ -72,7 +73,5 @@ def lambda_handler(event, context):
             db.close()
             
     except Exception as e:
-        print(f"Reset draft error: {str(e)}")
-        import traceback
-        print(f"Reset draft traceback: {traceback.format_exc()}")
+        log_exception("Reset draft", e)
         return error_response('Failed to reset draft', 500)
@@ -5,7 +5,9 @@ import os
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam
 from shared.responses import success_response, error_response, validation_error_response, not_found_response
-from shared.auth import require_auth, require_league_creator
+from shared.auth import require_auth, require_league_creator, get_user_id_from_event
+from shared.cache import invalidate_league_cache
+from sqlalchemy import and_, exists, update
 
 @require_auth
 def lambda_handler(event, context):
@@ -18,32 +20,40 @@ def lambda_handler(event, context):
         
         db = get_db_session()
         try:
-            # Verify league exists
-            league = db.query(League).filter(League.id == league_id).first()
-            if not league:
-                return not_found_response('League')
+            # Update league status directly to active - the creator, pre_draft status and
+            # at least one player are all conditions of the same UPDATE
+            activated = db.execute(
+                update(League.__table__)
+                .where(and_(
+                    League.id == league_id,
+                    League.created_by == get_user_id_from_event(event),
+                    League.status == 'pre_draft',
+                    exists().where(LeagueTeam.league_id == League.id)
+                ))
+                .values(status='active')
+                .returning(League.id)
+            ).first()
             
-            # Check if user is the league creator
-            creator_check = require_league_creator(league, event, "skip the draft")
-            if creator_check:
-                return creator_check
-            
-            # Check league status - can only skip draft from pre_draft
-            if league.status != 'pre_draft':
-                return error_response(f'Cannot skip draft - league status is {league.status}', 400)
-            
-            # Get all teams in the league
-            league_teams = db.query(LeagueTeam).filter(
-                LeagueTeam.league_id == league_id
-            ).all()
-            
-            if len(league_teams) < 1:
+            if not activated:
+                db.rollback()
+                # Nothing was updated - work out which check failed for the error response
+                league = db.query(League).filter(League.id == league_id).first()
+                if not league:
+                    return not_found_response('League')
+                
+                # Check if user is the league creator
+                creator_check = require_league_creator(league, event, "skip the draft")
+                if creator_check:
+                    return creator_check
+                
+                # Check league status - can only skip draft from pre_draft
+                if league.status != 'pre_draft':
+                    return error_response(f'Cannot skip draft - league status is {league.status}', 400)
+                
                 return error_response('Need at least 1 player to activate league', 400)
             
-            # Update league status directly to active
-            league.status = 'active'
-            
             db.commit()
+            invalidate_league_cache(league_id)
             
             return success_response({
                 'message': 'League activated successfully. You can now manually assign teams to players.',
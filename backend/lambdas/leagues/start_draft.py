@@ -1,13 +1,13 @@
 import json
 import sys
 import os
-import random
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, LeagueDraft, User
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception
 from shared.auth import require_auth, require_league_creator
-from sqlalchemy import and_, func
+from shared.cache import invalidate_league_cache
+from sqlalchemy import and_, func, select, update
 
 @require_auth
 def lambda_handler(event, context):
@@ -34,14 +34,6 @@ def lambda_handler(event, context):
             if league.status != 'pre_draft':
                 return error_response(f'Cannot start draft - league status is {league.status}', 400)
             
-            # Get all teams in the league
-            league_teams = db.query(LeagueTeam).filter(
-                LeagueTeam.league_id == league_id
-            ).all()
-            
-            if len(league_teams) < 2:
-                return error_response('Need at least 2 players to start draft', 400)
-            
             # Check if draft already exists
             existing_draft = db.query(LeagueDraft).filter(
                 LeagueDraft.league_id == league_id
@@ -50,13 +42,30 @@ def lambda_handler(event, context):
             if existing_draft:
                 return error_response('Draft has already been started for this league', 409)
             
-            # Randomize draft order
-            teams_list = list(league_teams)
-            random.shuffle(teams_list)
-            
-            # Update draft positions
-            for i, team in enumerate(teams_list):
-                team.draft_position = i + 1
+            # Randomize draft order in Postgres: number the teams in random order and write
+            # every draft position in one UPDATE, returning what the response needs
+            league_teams = LeagueTeam.__table__
+            users = User.__table__
+            shuffled = select(
+                league_teams.c.user_id,
+                func.row_number().over(order_by=func.random()).label('position')
+            ).where(league_teams.c.league_id == league_id).cte('shuffled')
+            
+            teams_list = sorted(db.execute(
+                update(league_teams)
+                .where(and_(
+                    league_teams.c.league_id == league_id,
+                    league_teams.c.user_id == shuffled.c.user_id,
+                    users.c.id == league_teams.c.user_id
+                ))
+                .values(draft_position=shuffled.c.position)
+                .returning(league_teams.c.draft_position, league_teams.c.user_id,
+                           league_teams.c.team_name, users.c.display_name)
+            ).all(), key=lambda team: team.draft_position)
+            
+            if len(teams_list) < 2:
+                db.rollback()
+                return error_response('Need at least 2 players to start draft', 400)
             
             # Calculate total picks
             total_picks = len(teams_list) * league.max_teams_per_user
@@ -76,20 +85,15 @@ def lambda_handler(event, context):
             
             db.add(draft)
             db.commit()
+            invalidate_league_cache(league_id)
             
-            # Get updated team info with user details for response
-            teams_with_users = db.query(LeagueTeam, User).join(
-                User, LeagueTeam.user_id == User.id
-            ).filter(
-                LeagueTeam.league_id == league_id
-            ).order_by(LeagueTeam.draft_position).all()
-            
+            # teams_list came back from the UPDATE, sorted into draft order
             draft_order = []
-            for team, user in teams_with_users:
+            for team in teams_list:
                 draft_order.append({
                     'draftPosition': team.draft_position,
-                    'userId': str(user.id),
-                    'displayName': user.display_name,
+                    'userId': str(team.user_id),
+                    'displayName': team.display_name,
                     'teamName': team.team_name
                 })
             
@@ -108,8 +112,5 @@ def lambda_handler(event, context):
             db.close()
             
     except Exception as e:
-        print(f"Start draft error: {str(e)}")
-        print(f"Start draft error type: {type(e)}")
-        import traceback
-        print(f"Start draft traceback: {traceback.format_exc()}")
+        log_exception("Start draft", e)
         return error_response('Failed to start draft', 500)
@@ -4,13 +4,15 @@ Update player team assignments (admin only)
 
 import json
 from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert
 import sys
 import os
 
 # Import from layer
-from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment, User, School
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.database import get_db_session, in_array, League, LeagueTeam, LeagueTeamSchoolAssignment, User, School
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception, parse_body
 from shared.auth import require_auth, get_user_id_from_event
+from shared.cache import invalidate_league_cache
 
 @require_auth
 def lambda_handler(event, context):
@@ -26,9 +28,7 @@ def lambda_handler(event, context):
             return validation_error_response({'userId': 'Player user ID is required'})
         
         # Parse body
-        body = event.get('body', '{}')
-        if isinstance(body, str):
-            body = json.loads(body)
+        body = parse_body(event)
         
         admin_user_id = get_user_id_from_event(event)
         
@@ -42,8 +42,9 @@ def lambda_handler(event, context):
         
         db = get_db_session()
         try:
-            # Verify league exists and user is creator
-            league = db.query(League).filter(League.id == league_id).first()
+            # Verify league exists and user is creator - the league row is only read here,
+            # so fetch just the columns this handler uses instead of hydrating a League
+            league = db.query(League.created_by, League.max_teams_per_user).filter(League.id == league_id).first()
             if not league:
                 return not_found_response('League')
             
@@ -65,11 +66,15 @@ def lambda_handler(event, context):
             player = db.query(User).filter(User.id == player_user_id).first()
             player_name = player.display_name if player else "Unknown Player"
             
-            # Validate that all school IDs exist and are not already taken by other players
+            # Validate that all school IDs exist (conflicts with other players are caught by the insert)
             school_ids = [assignment['schoolId'] for assignment in team_assignments]
+            if len(set(school_ids)) != len(school_ids):
+                return validation_error_response({'teamAssignments': 'Each school can only be assigned once'})
             
             # Check if schools exist
-            existing_schools = db.query(School).filter(School.id.in_(school_ids)).all()
+            existing_schools = db.query(
+                School.id, School.name, School.mascot, School.conference, School.primary_color
+            ).filter(in_array(School.id, school_ids)).all()
             existing_school_ids = {school.id for school in existing_schools}
             
             missing_schools = set(school_ids) - existing_school_ids
@@ -78,21 +83,6 @@ def lambda_handler(event, context):
                     'teamAssignments': f'Schools not found: {list(missing_schools)}'
                 })
             
-            # Check for conflicts with other players (excluding the current player)
-            conflicting_assignments = db.query(LeagueTeamSchoolAssignment).filter(
-                and_(
-                    LeagueTeamSchoolAssignment.league_id == league_id,
-                    LeagueTeamSchoolAssignment.user_id != player_user_id,
-                    LeagueTeamSchoolAssignment.school_id.in_(school_ids)
-                )
-            ).all()
-            
-            if conflicting_assignments:
-                conflicts = [(assignment.school_id, assignment.user_id) for assignment in conflicting_assignments]
-                return error_response(
-                    f'Some schools are already assigned to other players: {conflicts}', 400
-                )
-            
             # Validate team count doesn't exceed league limit
             if len(team_assignments) > league.max_teams_per_user:
                 return error_response(
@@ -105,36 +95,59 @@ def lambda_handler(event, context):
                     LeagueTeamSchoolAssignment.league_id == league_id,
                     LeagueTeamSchoolAssignment.user_id == player_user_id
                 )
-            ).delete()
+            ).delete(synchronize_session=False)  # Rows are never loaded in this session
             
             # Add new assignments
             new_assignments = []
+            assignment_rows = []
             for i, assignment in enumerate(team_assignments):
                 school_id = assignment['schoolId']
                 draft_round = assignment.get('draftRound', i + 1)  # Default to sequential rounds
                 draft_pick_overall = assignment.get('draftPickOverall')  # Optional
                 
-                new_assignment = LeagueTeamSchoolAssignment(
-                    league_id=league_id,
-                    user_id=player_user_id,
-                    school_id=school_id,
-                    draft_round=draft_round,
-                    draft_pick_overall=draft_pick_overall
-                )
-                
-                db.add(new_assignment)
+                assignment_rows.append({
+                    'league_id': league_id,
+                    'user_id': player_user_id,
+                    'school_id': school_id,
+                    'draft_round': draft_round,
+                    'draft_pick_overall': draft_pick_overall
+                })
                 new_assignments.append({
                     'schoolId': school_id,
                     'draftRound': draft_round,
                     'draftPickOverall': draft_pick_overall
                 })
             
+            # One multi-row INSERT; schools already held by another player in this league hit
+            # UNIQUE(league_id, school_id) and are skipped instead of checked for up front
+            if assignment_rows:
+                inserted_school_ids = set(db.execute(
+                    insert(LeagueTeamSchoolAssignment)
+                    .values(assignment_rows)
+                    .on_conflict_do_nothing(index_elements=['league_id', 'school_id'])
+                    .returning(LeagueTeamSchoolAssignment.school_id)
+                ).scalars())
+                
+                conflicting_school_ids = set(school_ids) - inserted_school_ids
+                if conflicting_school_ids:
+                    db.rollback()
+                    conflicts = db.query(
+                        LeagueTeamSchoolAssignment.school_id,
+                        LeagueTeamSchoolAssignment.user_id
+                    ).filter(
+                        LeagueTeamSchoolAssignment.league_id == league_id,
+                        in_array(LeagueTeamSchoolAssignment.school_id, conflicting_school_ids)
+                    ).all()
+                    return error_response(
+                        f'Some schools are already assigned to other players: {[tuple(c) for c in conflicts]}', 400
+                    )
+            
             db.commit()
+            invalidate_league_cache(league_id)
             
-            # Get school details for response
-            updated_schools = db.query(School).filter(School.id.in_(school_ids)).all()
+            # School details for the response - these are the schools validated above
             school_details = []
-            for school in updated_schools:
+            for school in existing_schools:
                 school_details.append({
                     'id': school.id,
                     'name': school.name,
@@ -160,7 +173,5 @@ def lambda_handler(event, context):
     except json.JSONDecodeError:
         return validation_error_response({'body': 'Invalid JSON format'})
     except Exception as e:
-        print(f"Update player teams error: {str(e)}")
-        import traceback
-        print(f"Update player teams traceback: {traceback.format_exc()}")
+        log_exception("Update player teams", e)
         return error_response('Failed to update player teams', 500)
@@ -4,14 +4,19 @@ Update league settings (admin only)
 
 import json
 import re
-from sqlalchemy import and_
+from sqlalchemy import and_, exists, func, update
+from sqlalchemy.orm.attributes import set_committed_value
 import sys
 import os
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception, parse_body
 from shared.auth import require_auth, get_user_id_from_event
+from shared.cache import invalidate_league_cache
+
+# 4-8 alphanumeric characters; \Z so a trailing newline doesn't slip through like it does with $
+JOIN_CODE_PATTERN = re.compile(r'^[A-Z0-9]{4,8}\Z')
 
 @require_auth
 def lambda_handler(event, context):
@@ -23,9 +28,7 @@ def lambda_handler(event, context):
             return validation_error_response({'id': 'League ID is required'})
         
         # Parse body
-        body = event.get('body', '{}')
-        if isinstance(body, str):
-            body = json.loads(body)
+        body = parse_body(event)
         
         user_id = get_user_id_from_event(event)
         
@@ -49,7 +52,7 @@ def lambda_handler(event, context):
             
             join_code = join_code.strip().upper()
             
-            if not re.match(r'^[A-Z0-9]{4,8}$', join_code):
+            if not JOIN_CODE_PATTERN.match(join_code):
                 return validation_error_response({'joinCode': 'Join code must be 4-8 alphanumeric characters'})
         
         db = get_db_session()
@@ -76,11 +79,13 @@ def lambda_handler(event, context):
             if max_teams_per_user is not None:
                 # Check if reducing max teams would invalidate existing picks
                 if max_teams_per_user < league.max_teams_per_user:
-                    # Count existing picks per user
-                    max_existing_picks = db.query(LeagueTeamSchoolAssignment.user_id)\
+                    # Largest number of picks any one user has (the old .count() here
+                    # returned the number of users with picks, not their pick counts)
+                    picks_per_user = db.query(func.count(LeagueTeamSchoolAssignment.school_id).label('picks'))\
                         .filter(LeagueTeamSchoolAssignment.league_id == league_id)\
                         .group_by(LeagueTeamSchoolAssignment.user_id)\
-                        .count()
+                        .subquery()
+                    max_existing_picks = db.query(func.max(picks_per_user.c.picks)).scalar() or 0
                     
                     if max_existing_picks > max_teams_per_user:
                         return error_response(f'Cannot reduce max teams - some players already have {max_existing_picks} teams', 400)
@@ -89,19 +94,31 @@ def lambda_handler(event, context):
                 updated_fields['maxTeamsPerUser'] = league.max_teams_per_user
             
             if join_code is not None:
-                # Check if another league already has this join code
-                existing_league = db.query(League)\
-                    .filter(League.join_code == join_code)\
-                    .filter(League.id != league_id)\
-                    .first()
+                # Set the join code unless another league already has it - one guarded UPDATE
+                # instead of a lookup followed by a write
+                leagues = League.__table__
+                other_league = leagues.alias('other_league')
+                result = db.execute(
+                    update(leagues)
+                    .where(and_(
+                        leagues.c.id == league_id,
+                        ~exists().where(and_(
+                            other_league.c.join_code == join_code,
+                            other_league.c.id != league_id
+                        ))
+                    ))
+                    .values(join_code=join_code)
+                )
                 
-                if existing_league:
+                if result.rowcount == 0:
                     return validation_error_response({'joinCode': 'This join code is already in use by another league'})
                 
-                league.join_code = join_code
+                # Already written above, so don't flush it again at commit
+                set_committed_value(league, 'join_code', join_code)
                 updated_fields['joinCode'] = league.join_code
             
             db.commit()
+            invalidate_league_cache(league_id)
             
             return success_response({
                 'id': str(league.id),
@@ -119,7 +136,5 @@ def lambda_handler(event, context):
     except json.JSONDecodeError:
         return validation_error_response({'body': 'Invalid JSON format'})
     except Exception as e:
-        print(f"Update league settings error: {str(e)}")
-        import traceback
-        print(f"Update league settings traceback: {traceback.format_exc()}")
+        log_exception("Update league settings", e)
         return error_response('Failed to update league settings', 500)
@@ -3,14 +3,15 @@ Update team name for a user in a league
 """
 
 import json
-from sqlalchemy import and_
+from sqlalchemy import and_, update
 import sys
 import os
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, User
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception, parse_body
 from shared.auth import require_auth, get_user_id_from_event
+from shared.cache import invalidate_league_cache
 
 @require_auth
 def lambda_handler(event, context):
@@ -23,9 +24,7 @@ def lambda_handler(event, context):
             return validation_error_response({'id': 'League ID is required'})
         
         # Parse body
-        body = event.get('body', '{}')
-        if isinstance(body, str):
-            body = json.loads(body)
+        body = parse_body(event)
         
         user_id = get_user_id_from_event(event)
         
@@ -42,28 +41,29 @@ def lambda_handler(event, context):
         
         db = get_db_session()
         try:
-            # Verify league exists
-            league = db.query(League).filter(League.id == league_id).first()
-            if not league:
-                return not_found_response('League')
-            
-            # Verify the user is a member of this league
-            league_team = db.query(LeagueTeam).filter(
-                and_(
+            # Update the team name and read back the user info for the response in one
+            # statement (UPDATE ... FROM users ... RETURNING); no row means no membership
+            user = db.execute(
+                update(LeagueTeam.__table__)  # Core UPDATE: RETURNING the users columns as given
+                .where(and_(
                     LeagueTeam.league_id == league_id,
-                    LeagueTeam.user_id == user_id
-                )
+                    LeagueTeam.user_id == user_id,
+                    User.id == LeagueTeam.user_id
+                ))
+                .values(team_name=team_name)
+                .returning(User.id, User.display_name)
             ).first()
             
-            if not league_team:
+            if not user:
+                db.rollback()
+                # Only the failure path needs to tell a missing league from a non-member
+                league = db.query(League.id).filter(League.id == league_id).first()
+                if not league:
+                    return not_found_response('League')
                 return not_found_response('You are not a member of this league')
             
-            # Update the team name
-            league_team.team_name = team_name
             db.commit()
-            
-            # Get user info for response
-            user = db.query(User).filter(User.id == user_id).first()
+            invalidate_league_cache(league_id)
             
             return success_response({
                 'message': 'Team name updated successfully',
@@ -80,7 +80,5 @@ def lambda_handler(event, context):
     except json.JSONDecodeError:
         return validation_error_response({'body': 'Invalid JSON format'})
     except Exception as e:
-        print(f"Update team name error: {str(e)}")
-        import traceback
-        print(f"Update team name traceback: {traceback.format_exc()}")
+        log_exception("Update team name", e)
         return error_response('Failed to update team name', 500)
@@ -4,8 +4,15 @@ Simple lookup to enable viewing league standings
 """
 
 import json
+import time
 from shared.database import get_db_session, League
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception
+
+# Shared links hit this repeatedly, so warm containers keep found leagues for a
+# short while: {join_code: (cached_at, payload)}. Join codes can be changed in
+# update_settings, which can't reach other containers - the TTL bounds the staleness.
+JOIN_CODE_TTL_SECONDS = 60
+_league_by_code_cache = {}
 
 def lambda_handler(event, context):
     """Get league ID from join code - no auth required"""
@@ -18,25 +25,31 @@ def lambda_handler(event, context):
         
         join_code = join_code.upper()
         
+        cached = _league_by_code_cache.get(join_code)
+        if cached and time.monotonic() - cached[0] < JOIN_CODE_TTL_SECONDS:
+            return success_response(cached[1])
+        
         db = get_db_session()
         
         try:
             # Look up the league
-            league = db.query(League).filter(League.join_code == join_code).first()
+            league = db.query(League.id, League.name).filter(League.join_code == join_code).first()
             
             if not league:
                 return not_found_response('League not found with that join code')
             
-            return success_response({
+            league_info = {
                 'leagueId': str(league.id),
                 'name': league.name
-            })
+            }
+            # Only hits are cached, so a newly created code is found right away
+            _league_by_code_cache[join_code] = (time.monotonic(), league_info)
+            
+            return success_response(league_info)
             
         finally:
             db.close()
             
     except Exception as e:
-        print(f"View league by code error: {str(e)}")
-        import traceback
-        print(f"View league by code traceback: {traceback.format_exc()}")
+        log_exception("View league by code", e)
         return error_response('Failed to load league information', 500)
@@ -1,12 +1,29 @@
-import json
-import sys
-import os
-
 # Import from layer  
-from shared.database import get_db_session, School, LeagueTeam, LeagueTeamSchoolAssignment
-from shared.responses import success_response, error_response
-from shared.auth import require_auth
-from sqlalchemy import and_, not_
+from shared.database import get_db_session, School, LeagueTeamSchoolAssignment
+from shared.responses import success_response, error_response, log_exception
+from shared.cache import get_cached_json, set_cached_json, fbs_schools_key
+from sqlalchemy import select
+
+# Define FBS conferences to filter to only FBS schools
+FBS_CONFERENCES = (
+    'ACC', 'American Athletic', 'Big 12', 'Big Ten', 'Conference USA',
+    'FBS Independents', 'Mid-American', 'Mountain West', 'Pac-12',
+    'SEC', 'Sun Belt'
+)
+# The conference filter options are the same fixed list, sorted once
+FBS_CONFERENCE_LIST = sorted(FBS_CONFERENCES)
+
+# The school list only changes when season_init loads schools; isTaken is never cached
+SCHOOLS_CACHE_TTL_SECONDS = 300
+
+# Without a league the response is the same for everyone, so browsers and CloudFront
+# may reuse it; league-scoped responses carry live isTaken flags and aren't cacheable
+PUBLIC_CACHE_HEADERS = {'Cache-Control': 'public, max-age=60, stale-while-revalidate=300'}
+
+# Built once per container; SQLAlchemy's compiled cache reuses its SQL on warm calls
+FBS_SCHOOLS_STMT = select(School)\
+    .where(School.conference.in_(FBS_CONFERENCES))\
+    .order_by(School.name)
 
 def lambda_handler(event, context):
     """Get available schools for team selection in a league"""
@@ -19,73 +36,62 @@ def lambda_handler(event, context):
         
         db = get_db_session()
         try:
-            # Define FBS conferences to filter to only FBS schools
-            fbs_conferences = [
-                'ACC', 'American Athletic', 'Big 12', 'Big Ten', 'Conference USA',
-                'FBS Independents', 'Mid-American', 'Mountain West', 'Pac-12', 
-                'SEC', 'Sun Belt'
-            ]
-            
-            # Start with only FBS schools by filtering by conference
-            query = db.query(School).filter(School.conference.in_(fbs_conferences)).order_by(School.name)
+            # Schools already picked in this league, fetched once for every school's isTaken
+            taken_school_ids = set()
+            if league_id:
+                taken_school_ids = {
+                    school_id for (school_id,) in db.query(LeagueTeamSchoolAssignment.school_id)
+                        .filter(LeagueTeamSchoolAssignment.league_id == league_id)
+                        .all()
+                }
             
-            # Filter by conference if specified
-            if conference:
-                query = query.filter(School.conference == conference)
+            # Only the known FBS conferences are cached - anything else can't match an FBS
+            # school, and caching it would let arbitrary query strings create Redis keys
+            if conference and conference not in FBS_CONFERENCES:
+                schools = []
+            else:
+                schools = get_cached_json(fbs_schools_key(conference))
+            if schools is None:
+                # Start with only FBS schools by filtering by conference
+                query = FBS_SCHOOLS_STMT
+                
+                # Filter by conference if specified
+                if conference:
+                    query = query.where(School.conference == conference)
+                
+                schools = [
+                    {
+                        'id': school.id,
+                        'name': school.name,
+                        'mascot': school.mascot,
+                        'abbreviation': school.abbreviation,
+                        'conference': school.conference,
+                        'primaryColor': school.primary_color,
+                        'secondaryColor': school.secondary_color
+                    }
+                    for school in db.execute(query).scalars()
+                ]
+                set_cached_json(fbs_schools_key(conference), schools, SCHOOLS_CACHE_TTL_SECONDS)
             
             # If league_id provided and available_only is true, exclude already picked teams
             if league_id and available_only:
-                taken_school_ids = db.query(LeagueTeamSchoolAssignment.school_id)\
-                    .filter(LeagueTeamSchoolAssignment.league_id == league_id)\
-                    .subquery()
-                query = query.filter(not_(School.id.in_(taken_school_ids)))
-            
-            schools = query.all()
+                schools = [school for school in schools if school['id'] not in taken_school_ids]
             
-            # Format response
-            schools_data = []
-            for school in schools:
-                # Check if already taken in this league
-                is_taken = False
-                if league_id:
-                    taken = db.query(LeagueTeamSchoolAssignment)\
-                        .filter(and_(LeagueTeamSchoolAssignment.league_id == league_id, 
-                                   LeagueTeamSchoolAssignment.school_id == school.id))\
-                        .first()
-                    is_taken = taken is not None
-                
-                schools_data.append({
-                    'id': school.id,
-                    'name': school.name,
-                    'mascot': school.mascot,
-                    'abbreviation': school.abbreviation,
-                    'conference': school.conference,
-                    'primaryColor': school.primary_color,
-                    'secondaryColor': school.secondary_color,
-                    'isTaken': is_taken
-                })
-            
-            # Get unique FBS conferences for filtering
-            conferences = db.query(School.conference)\
-                .filter(School.conference.in_(fbs_conferences))\
-                .filter(School.conference.isnot(None))\
-                .distinct()\
-                .order_by(School.conference)\
-                .all()
-            conference_list = [c[0] for c in conferences]
+            # Format response - check if each school is already taken in this league
+            schools_data = [
+                {**school, 'isTaken': school['id'] in taken_school_ids}
+                for school in schools
+            ]
             
             return success_response({
                 'schools': schools_data,
-                'conferences': conference_list,
+                'conferences': FBS_CONFERENCE_LIST,
                 'total': len(schools_data)
-            })
+            }, headers=None if league_id else PUBLIC_CACHE_HEADERS)
             
         finally:
             db.close()
             
     except Exception as e:
-        print(f"Get schools error: {str(e)}")
-        print(f"Get schools error type: {type(e)}")
-        import traceback
-        print(f"Get schools traceback: {traceback.format_exc()}")
+        log_exception("Get schools", e)
         return error_response('Failed to get schools', 500)
@@ -0,0 +1,72 @@
+"""
+Optional Redis (ElastiCache) cache for Pick6 lambdas
+
+Caching is enabled only when REDIS_URL is set and redis-py is installed in the
+layer. Otherwise every call is a no-op, so handlers behave exactly as without
+a cache. Cache errors are logged and treated as misses - the database stays the
+source of truth.
+"""
+import os
+import json
+from typing import Any, Optional
+
+try:
+    import redis
+except ImportError:  # redis-py is optional
+    redis = None
+
+REDIS_URL = os.getenv('REDIS_URL')
+
+# Created once per container during the Lambda init phase and reused while warm
+_client = None
+if redis is not None and REDIS_URL:
+    _client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+def cache_enabled() -> bool:
+    """Whether a Redis cache is configured for this container"""
+    return _client is not None
+
+def get_cached_json(key: str) -> Optional[Any]:
+    """Return the cached JSON value for key, or None on a miss or cache error"""
+    if _client is None:
+        return None
+    try:
+        cached = _client.get(key)
+        return json.loads(cached) if cached is not None else None
+    except Exception as e:
+        print(f"Cache get failed for {key}: {str(e)}")
+        return None
+
+def set_cached_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """Store value as JSON under key with a TTL (no-op without a cache)"""
+    if _client is None:
+        return
+    try:
+        _client.setex(key, ttl_seconds, json.dumps(value))
+    except Exception as e:
+        print(f"Cache set failed for {key}: {str(e)}")
+
+def delete_cached(*keys: str) -> None:
+    """Drop keys from the cache (no-op without a cache)"""
+    if _client is None or not keys:
+        return
+    try:
+        _client.delete(*keys)
+    except Exception as e:
+        print(f"Cache delete failed for {keys}: {str(e)}")
+
+def league_settings_key(league_id) -> str:
+    return f"league:{league_id}:settings"
+
+def league_lobby_key(league_id) -> str:
+    return f"league:{league_id}:lobby"
+
+def league_standings_key(league_id) -> str:
+    return f"league:{league_id}:standings"
+
+def fbs_schools_key(conference) -> str:
+    return f"schools:fbs:{conference or 'all'}"
+
+def invalidate_league_cache(league_id) -> None:
+    """Drop cached league snapshots after a write to the league's members, picks or settings"""
+    delete_cached(league_settings_key(league_id), league_lobby_key(league_id), league_standings_key(league_id))
@@ -0,0 +1,68 @@
+"""
+WebSocket connection lookups for Pick6 lambdas
+
+Connections live in the DynamoDB connections table keyed by connection_id. The
+league_id-index GSI lets a league's connections be read with a Query instead of
+scanning the whole table on every broadcast.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+from boto3.dynamodb.conditions import Key
+
+logger = logging.getLogger(__name__)
+
+LEAGUE_INDEX_NAME = 'league_id-index'
+
+# Each post_to_connection is an HTTPS round trip that releases the GIL, so sends to
+# a league's connections overlap in threads instead of queueing one after another
+BROADCAST_MAX_WORKERS = 16
+
+def query_league_connections(connections_table, league_id) -> List[Dict[str, Any]]:
+    """Return every connection item subscribed to a league, following Query pagination"""
+    query_kwargs = {
+        'IndexName': LEAGUE_INDEX_NAME,
+        'KeyConditionExpression': Key('league_id').eq(str(league_id))
+    }
+    items = []
+    while True:
+        response = connections_table.query(**query_kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            return items
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def post_to_connections(api_gateway, connections_table, connection_ids: Iterable[str], data: str) -> Tuple[int, int]:
+    """Send data to every connection concurrently and delete the ones that are gone
+    
+    The management API client is thread-safe; the DynamoDB table resource is not, so
+    stale connections are deleted from the calling thread once the sends finish.
+    
+    Returns:
+        (successful_sends, failed_sends)
+    """
+    connection_ids = list(connection_ids)
+    if not connection_ids:
+        return 0, 0
+    
+    def send(connection_id):
+        try:
+            api_gateway.post_to_connection(ConnectionId=connection_id, Data=data)
+            return 'sent'
+        except api_gateway.exceptions.GoneException:
+            return 'gone'
+        except Exception as e:
+            logger.warning("Error sending to connection %s: %s", connection_id, e)
+            return 'failed'
+    
+    with ThreadPoolExecutor(max_workers=min(BROADCAST_MAX_WORKERS, len(connection_ids))) as executor:
+        results = list(executor.map(send, connection_ids))
+    
+    for connection_id, result in zip(connection_ids, results):
+        if result == 'gone':
+            # Connection is stale, remove it
+            connections_table.delete_item(Key={'connection_id': connection_id})
+            logger.info("Removed stale connection: %s", connection_id)
+    
+    successful_sends = results.count('sent')
+    return successful_sends, len(results) - successful_sends
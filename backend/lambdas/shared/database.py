@@ -1,7 +1,8 @@
 import os
-from sqlalchemy import create_engine, Column, String, Integer, UUID, TIMESTAMP, ForeignKey, Boolean, Numeric, ForeignKeyConstraint
+import atexit
+from sqlalchemy import create_engine, any_, bindparam, Column, String, Integer, TIMESTAMP, ForeignKey, Boolean, Numeric, ForeignKeyConstraint, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, raiseload
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, ARRAY
 from uuid import uuid4
 from datetime import datetime
@@ -14,8 +15,21 @@ import ssl
 clean_url = DATABASE_URL.replace('postgresql://', 'postgresql+pg8000://').split('?')[0]
 ssl_context = ssl.create_default_context()
 ssl_context.check_hostname = False  # Neon uses different hostname in cert
-engine = create_engine(clean_url, connect_args={"ssl_context": ssl_context})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# One engine per Lambda container, so warm invocations reuse the open connection
+# instead of redoing TCP + TLS + auth. A container serves one request at a time;
+# the overflow covers helpers (e.g. week_utils) that open a second session mid-request.
+engine = create_engine(
+    clean_url,
+    connect_args={"ssl_context": ssl_context},
+    pool_size=1,
+    max_overflow=2,
+    pool_pre_ping=True,  # Neon drops idle connections while the container is frozen
+    pool_recycle=280
+)
+atexit.register(engine.dispose)
+# Handlers only read back values they just wrote, so keep them after commit
+# instead of expiring every instance and re-SELECTing it on the next access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 # Database Models
@@ -44,6 +58,7 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
     display_name = Column(String(100), nullable=False)
+    is_manual = Column(Boolean, default=False)  # Placeholder user created by add_manual_team
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
     updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -136,9 +151,12 @@ class LeagueTeamSchoolAssignment(Base):
     draft_pick_overall = Column(Integer)  # 1-16 in 4-person league
     drafted_at = Column(TIMESTAMP, default=datetime.utcnow)
     
-    # Add composite foreign key constraint
+    # Add composite foreign key constraint. The (league_id, user_id, school_id) primary key
+    # already serves (league_id, user_id) lookups; the unique constraints match complete_schema.sql
     __table_args__ = (
         ForeignKeyConstraint(['league_id', 'user_id'], ['league_teams.league_id', 'league_teams.user_id']),
+        UniqueConstraint('league_id', 'school_id'),  # each school can only be picked once per league
+        UniqueConstraint('league_id', 'draft_pick_overall'),  # each overall pick number is unique
     )
     
     # Relationships
@@ -177,9 +195,44 @@ def get_db():
         db.close()
 
 def get_db_session():
-    """Get database session - for direct use"""
+    """Get database session - for direct use
+    
+    Closing the session returns its connection to the pool; it is not disconnected.
+    """
     return SessionLocal()
 
+def in_array(column, values):
+    """`column = ANY(:values)` - one array parameter instead of an IN (...) parameter per value
+    
+    Keeps statement text and parse cost constant for bulk filters and stays clear of
+    Postgres' bind-parameter limit. Postgres-only (the app has no SQLite path).
+    """
+    return column == any_(bindparam(None, list(values), type_=ARRAY(column.type)))
+
+# Set STRICT_LOADING=true (e.g. locally) to make unplanned relationship lazy loads raise
+# instead of silently issuing an extra query per row
+STRICT_LOADING = os.getenv('STRICT_LOADING', '').lower() in ('1', 'true', 'yes')
+
+def strict_loading_options():
+    """Query options for read paths that eager-load everything they use"""
+    return (raiseload('*'),) if STRICT_LOADING else ()
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
+
+def warm_up_connection():
+    """Open the pooled connection ahead of the first request
+    
+    Runs during Lambda INIT (full CPU, and already paid for under provisioned concurrency),
+    so a cold start's first query is a pool checkout instead of DNS + TCP + TLS + auth.
+    """
+    try:
+        engine.connect().close()
+    except Exception as e:
+        # The first request will retry the connect and surface any real error
+        print(f"Database warm-up failed: {str(e)}")
+
+# Only inside Lambda - local scripts and imports shouldn't need a reachable database
+if os.getenv('AWS_LAMBDA_FUNCTION_NAME') and os.getenv('DB_WARMUP', '1') != '0':
+    warm_up_connection()
@@ -4,6 +4,7 @@ Shared game processing utilities for loading and updating games from CFB API
 from datetime import datetime
 from typing import Dict, Optional, Tuple
 from shared.database import Game, School
+from sqlalchemy import text
 
 
 def parse_game_start_date(date_string: str) -> Optional[datetime]:
@@ -194,3 +195,21 @@ def process_api_game(db, api_game: Dict, internal_week: int = None, skip_existin
         print(f"Error processing game {api_game.get('id', 'Unknown')}: {str(e)}")
         return 'error'
 
+
+def refresh_school_season_records(db) -> None:
+    """
+    Refresh the school_season_records materialized view that standings read from
+    
+    Call after committing game changes. CONCURRENTLY keeps the view readable while it
+    refreshes. A failure is logged rather than raised - the games are already saved and
+    the next load refreshes again.
+    
+    Args:
+        db: Database session
+    """
+    try:
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY school_season_records"))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Failed to refresh school_season_records: {str(e)}")
@@ -1,6 +1,40 @@
+import hashlib
 import json
+import logging
+import os
 from typing import Any, Dict, Optional
 
+# Every handler imports this module, so the log level is set once per container here.
+# Handlers log progress at info/debug; LOG_LEVEL=INFO (or DEBUG) brings it back.
+# An unknown value falls back to WARNING rather than failing every function's init.
+_log_level = os.getenv('LOG_LEVEL', 'WARNING').strip().upper()
+if not isinstance(logging.getLevelName(_log_level), int):
+    _log_level = 'WARNING'
+logging.getLogger().setLevel(_log_level)
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson isn't in the layer
+    orjson = None
+
+def _dumps(payload: Any) -> str:
+    """Serialize a response body - orjson is several times faster on large member/team payloads"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload)
+
+def parse_body(event: Dict[str, Any]) -> Any:
+    """Parse the JSON request body (orjson when available); a missing or empty body is {}
+    
+    Malformed input raises json.JSONDecodeError - orjson's error subclasses it.
+    """
+    body = event.get('body') or '{}'
+    if not isinstance(body, (str, bytes, bytearray)):
+        return body  # Already parsed, e.g. a direct invocation
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
 def cors_headers() -> Dict[str, str]:
     """Standard CORS headers for all responses"""
     return {
@@ -9,20 +43,38 @@ def cors_headers() -> Dict[str, str]:
         'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
     }
 
-def success_response(data: Any, status_code: int = 200) -> Dict[str, Any]:
-    """Create a successful API response"""
+def success_response(data: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Create a successful API response (extra headers, e.g. Cache-Control, are merged in)"""
     return {
         'statusCode': status_code,
         'headers': {
             'Content-Type': 'application/json',
-            **cors_headers()
+            **cors_headers(),
+            **(headers or {})
         },
-        'body': json.dumps({
+        'body': _dumps({
             'success': True,
             'data': data
         })
     }
 
+def etag_response(event: Dict[str, Any], data: Any) -> Dict[str, Any]:
+    """Create a successful response with an ETag; 304 with no body when the client's copy matches
+    
+    Cache-Control: no-cache makes browsers revalidate each time, so an unchanged payload
+    costs a 304 instead of the full body.
+    """
+    response = success_response(data, headers={'Cache-Control': 'no-cache'})
+    etag = '"' + hashlib.md5(response['body'].encode()).hexdigest() + '"'
+    response['headers']['ETag'] = etag
+    
+    request_headers = event.get('headers') or {}
+    if_none_match = request_headers.get('If-None-Match') or request_headers.get('if-none-match')
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(',')):
+        response['statusCode'] = 304
+        response['body'] = ''
+    return response
+
 def error_response(message: str, status_code: int = 400, error_type: str = 'ClientError') -> Dict[str, Any]:
     """Create an error API response"""
     return {
@@ -31,7 +83,7 @@ def error_response(message: str, status_code: int = 400, error_type: str = 'Clie
             'Content-Type': 'application/json',
             **cors_headers()
         },
-        'body': json.dumps({
+        'body': _dumps({
             'success': False,
             'error': {
                 'type': error_type,
@@ -48,7 +100,7 @@ def validation_error_response(errors: Dict[str, str]) -> Dict[str, Any]:
             'Content-Type': 'application/json',
             **cors_headers()
         },
-        'body': json.dumps({
+        'body': _dumps({
             'success': False,
             'error': {
                 'type': 'ValidationError',
@@ -69,3 +121,10 @@ def unauthorized_response(message: str = 'Unauthorized') -> Dict[str, Any]:
 def server_error_response(message: str = 'Internal server error') -> Dict[str, Any]:
     """Create a server error response"""
     return error_response(message, 500, 'ServerError')
+
+def log_exception(context: str, error: Exception) -> None:
+    """Print an unexpected handler error with its traceback to CloudWatch"""
+    import traceback  # Only paid for once something has actually failed
+    print(f"{context} error: {str(error)}")
+    print(f"{context} error type: {type(error)}")
+    print(f"{context} traceback: {traceback.format_exc()}")
@@ -1,10 +1,16 @@
 """
 Week detection and management utilities for college football seasons
 """
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 from shared.database import get_db_session, Game
 from sqlalchemy import text
 
+# The current week changes at most a few times a week, so warm Lambda
+# containers reuse the answer for a short while: {season: (cached_at, week)}
+CURRENT_WEEK_TTL_SECONDS = 60
+_current_week_cache = {}
+
 def get_current_week_of_season(season):
     """
     Dynamically determine the current week based on game data
@@ -27,9 +33,32 @@ def get_current_week_of_season(season):
     if not season:
         raise ValueError("Season parameter is required")
     
+    cached = _current_week_cache.get(season)
+    if cached and time.monotonic() - cached[0] < CURRENT_WEEK_TTL_SECONDS:
+        return cached[1]
+    
+    week = _query_current_week(season)
+    _current_week_cache[season] = (time.monotonic(), week)
+    return week
+
+def _season_is_over(season):
+    """Bowls and the CFP finish in January, so a season is over from February of the next year"""
+    return date.today() >= date(int(season) + 1, 2, 1)
+
+def _query_current_week(season):
+    """Run the current-week detection queries for a season (uncached)"""
     db = get_db_session()
     
     try:
+        # Finished season: its last week is the current one, no need for the week analysis
+        if _season_is_over(season):
+            max_week = db.execute(text("""
+                SELECT COALESCE(MAX(week), 1) 
+                FROM games 
+                WHERE season = :season
+            """), {'season': season}).scalar()
+            return min(int(max_week or 1), 21)
+        
         # Complex query to find the "current" week for the specific season
         # Extended to week 20 to handle all bowl games
         query = text("""
@@ -1,15 +1,18 @@
-import json
-import sys
-import os
-from datetime import datetime
-from collections import defaultdict
+import logging
 
 # Import from layer
-from shared.database import get_db_session, League, User, LeagueTeam, LeagueTeamSchoolAssignment, School, Game
-from shared.responses import success_response, error_response, not_found_response
-from shared.auth import require_auth, get_user_id_from_event
-from sqlalchemy.orm import joinedload
-from sqlalchemy import and_, or_, case, func, literal_column
+from shared.database import get_db_session, in_array, League, User, LeagueTeam, LeagueTeamSchoolAssignment, School, Game
+from shared.responses import etag_response, error_response, not_found_response, log_exception
+from shared.cache import get_cached_json, set_cached_json, league_standings_key
+from shared.week_utils import get_current_week_of_season
+from sqlalchemy import and_, or_, text, case, literal, func
+
+# Query progress is info level; LOG_LEVEL decides whether it reaches CloudWatch
+logger = logging.getLogger(__name__)
+
+# Picks and settings writers call invalidate_league_cache; score updates from the
+# game loaders only show up once this expires
+STANDINGS_CACHE_TTL_SECONDS = 45
 
 def lambda_handler(event, context):
     """Get league standings with win calculations - OPTIMIZED VERSION
@@ -24,6 +27,10 @@ def lambda_handler(event, context):
         league_id = event['pathParameters']['league_id']
         # No auth required for public viewing
         
+        cached = get_cached_json(league_standings_key(league_id))
+        if cached is not None:
+            return etag_response(event, cached)
+        
         db = get_db_session()
         try:
             # Get league
@@ -33,113 +40,90 @@ def lambda_handler(event, context):
                 return not_found_response('League')
             
             # Get current week for recent game lookup
-            from shared.week_utils import get_current_week_of_season
             current_week = get_current_week_of_season(league.season)
             
-            print(f"🚀 OPTIMIZED: Fetching standings for league {league.name}, season {league.season}, week {current_week}")
+            logger.info("🚀 OPTIMIZED: Fetching standings for league %s, season %s, week %s", league.name, league.season, current_week)
             
             # =====================================================
-            # QUERY 1: Get all league members and their teams
+            # QUERY 1: Get all league members, then their drafted schools
             # =====================================================
-            # This replaces the nested loops with a single query
+            # Two narrow queries instead of one members x schools join, so member
+            # columns come back once per member rather than once per drafted school
             league_members_query = db.query(
                 LeagueTeam.user_id,
                 User.display_name,
-                LeagueTeam.team_name,
-                LeagueTeamSchoolAssignment.school_id,
+                LeagueTeam.team_name
+            ).join(
+                User, LeagueTeam.user_id == User.id
+            ).filter(
+                LeagueTeam.league_id == league_id
+            ).order_by(
+                LeagueTeam.user_id
+            ).all()
+            
+            drafted_schools_query = db.query(
+                LeagueTeamSchoolAssignment.user_id,
+                School.id.label('school_id'),
                 School.name.label('school_name'),
                 School.mascot,
                 School.conference,
                 School.primary_color
             ).join(
-                User, LeagueTeam.user_id == User.id
-            ).outerjoin(
-                LeagueTeamSchoolAssignment,
-                and_(
-                    LeagueTeamSchoolAssignment.league_id == LeagueTeam.league_id,
-                    LeagueTeamSchoolAssignment.user_id == LeagueTeam.user_id
-                )
-            ).outerjoin(
                 School, LeagueTeamSchoolAssignment.school_id == School.id
             ).filter(
-                LeagueTeam.league_id == league_id
+                LeagueTeamSchoolAssignment.league_id == league_id
             ).order_by(
-                LeagueTeam.user_id, LeagueTeamSchoolAssignment.school_id
+                LeagueTeamSchoolAssignment.user_id, LeagueTeamSchoolAssignment.school_id
             ).all()
             
-            print(f"📊 Query 1: Got {len(league_members_query)} member-team combinations")
+            logger.info("📊 Query 1: Got %s members and %s drafted schools", len(league_members_query), len(drafted_schools_query))
             
             # Group by user
-            users_teams = defaultdict(lambda: {'display_name': None, 'team_name': None, 'schools': []})
+            users_teams = {
+                str(row.user_id): {'display_name': row.display_name, 'team_name': row.team_name, 'schools': []}
+                for row in league_members_query
+            }
             all_school_ids = set()
             
-            for row in league_members_query:
-                user_id = str(row.user_id)
-                users_teams[user_id]['display_name'] = row.display_name
-                users_teams[user_id]['team_name'] = row.team_name
-                
-                if row.school_id:
-                    all_school_ids.add(row.school_id)
-                    users_teams[user_id]['schools'].append({
-                        'id': row.school_id,
-                        'name': row.school_name,
-                        'mascot': row.mascot,
-                        'conference': row.conference,
-                        'primaryColor': row.primary_color
-                    })
+            for row in drafted_schools_query:
+                user_team = users_teams.get(str(row.user_id))
+                if user_team is None:
+                    continue
+                all_school_ids.add(row.school_id)
+                user_team['schools'].append({
+                    'id': row.school_id,
+                    'name': row.school_name,
+                    'mascot': row.mascot,
+                    'conference': row.conference,
+                    'primaryColor': row.primary_color
+                })
             
-            print(f"👥 Found {len(users_teams)} users with {len(all_school_ids)} unique schools")
+            logger.info("👥 Found %s users with %s unique schools", len(users_teams), len(all_school_ids))
             
             # =====================================================
             # QUERY 2: Get win/loss records for ALL schools at once
             # =====================================================
             # This single query replaces 144 individual queries!
             if all_school_ids:
-                school_records_query = db.query(
-                    literal_column("school_id").label('school_id'),
-                    func.count().label('total_games'),
-                    func.sum(
-                        case(
-                            (literal_column("is_win") == True, 1),
-                            else_=0
-                        )
-                    ).label('wins')
-                ).select_from(
-                    db.query(
-                        Game.home_id.label('school_id'),
-                        (Game.home_points > Game.away_points).label('is_win')
-                    ).filter(
-                        and_(
-                            Game.season == league.season,
-                            Game.completed == True,
-                            Game.home_id.in_(all_school_ids)
-                        )
-                    ).union_all(
-                        db.query(
-                            Game.away_id.label('school_id'),
-                            (Game.away_points > Game.home_points).label('is_win')
-                        ).filter(
-                            and_(
-                                Game.season == league.season,
-                                Game.completed == True,
-                                Game.away_id.in_(all_school_ids)
-                            )
-                        )
-                    ).subquery()
-                ).group_by(
-                    literal_column("school_id")
-                ).all()
+                # Records are precomputed per (season, school) in the school_season_records
+                # materialized view, which the game loaders refresh after each load
+                school_records_query = db.execute(text("""
+                    SELECT school_id, wins, losses, total_games
+                    FROM school_season_records
+                    WHERE season = :season AND school_id = ANY(:school_ids)
+                """), {'season': league.season, 'school_ids': list(all_school_ids)}).all()
                 
                 # Build school records lookup
-                school_records = {}
-                for record in school_records_query:
-                    school_records[record.school_id] = {
-                        'wins': int(record.wins or 0),
-                        'total_games': int(record.total_games or 0),
-                        'losses': int(record.total_games or 0) - int(record.wins or 0)
+                school_records = {
+                    record.school_id: {
+                        'wins': int(record.wins),
+                        'total_games': int(record.total_games),
+                        'losses': int(record.losses)
                     }
+                    for record in school_records_query
+                }
                 
-                print(f"📈 Query 2: Calculated records for {len(school_records)} schools")
+                logger.info("📈 Query 2: Calculated records for %s schools", len(school_records))
             else:
                 school_records = {}
             
@@ -147,58 +131,64 @@ def lambda_handler(event, context):
             # QUERY 3: Get current/recent games for ALL schools
             # =====================================================
             if all_school_ids:
-                # Get current week games
-                current_games_query = db.query(
-                    Game,
-                    School.name.label('opponent_name')
-                ).outerjoin(
-                    School,
-                    or_(
-                        and_(Game.home_id.in_(all_school_ids), School.id == Game.away_id),
-                        and_(Game.away_id.in_(all_school_ids), School.id == Game.home_id)
-                    )
+                # Get current week games, then their opponents' names in one batched lookup.
+                # A game between two drafted schools counts for both of them.
+                current_games = db.query(
+                    Game.home_id,
+                    Game.away_id,
+                    Game.home_points,
+                    Game.away_points,
+                    Game.start_date,
+                    Game.week,
+                    case(
+                        (Game.completed == True, literal('completed')),
+                        # start_date is naive UTC, so compare against the UTC wall clock
+                        (Game.start_date <= func.timezone('UTC', func.now()), literal('in_progress')),
+                        else_=literal('scheduled')
+                    ).label('status')
                 ).filter(
                     and_(
                         Game.season == league.season,
                         Game.week == current_week,
                         or_(
-                            Game.home_id.in_(all_school_ids),
-                            Game.away_id.in_(all_school_ids)
+                            in_array(Game.home_id, all_school_ids),
+                            in_array(Game.away_id, all_school_ids)
                         )
                     )
-                ).all()
+                ).order_by(Game.start_date).all()
+                
+                opponent_ids = set()
+                for game in current_games:
+                    if game.home_id in all_school_ids:
+                        opponent_ids.add(game.away_id)
+                    if game.away_id in all_school_ids:
+                        opponent_ids.add(game.home_id)
+                opponent_names = dict(
+                    db.query(School.id, School.name).filter(in_array(School.id, opponent_ids)).all()
+                ) if opponent_ids else {}
                 
                 # Build school current games lookup
                 school_current_games = {}
-                for game, opponent_name in current_games_query:
-                    school_id = game.home_id if game.home_id in all_school_ids else game.away_id
-                    is_home = game.home_id == school_id
-                    
-                    # Determine game status
-                    if game.completed:
-                        status = 'completed'
-                    elif game.start_date:
-                        current_time = datetime.now()
-                        game_start = game.start_date
-                        if hasattr(game_start, 'replace') and game_start.tzinfo is not None:
-                            game_start = game_start.replace(tzinfo=None)
-                        status = 'in_progress' if game_start <= current_time else 'scheduled'
-                    else:
-                        status = 'scheduled'
-                    
-                    school_current_games[school_id] = {
-                        'opponent': opponent_name or 'TBD',
-                        'score': {
-                            'home': game.home_points or 0,
-                            'away': game.away_points or 0
-                        },
-                        'isHome': is_home,
-                        'status': status,
-                        'week': game.week,
-                        'date': game.start_date.strftime('%m/%d %I:%M %p') if game.start_date else 'TBD'
-                    }
+                for game in current_games:
+                    for school_id, opponent_id, is_home in (
+                        (game.home_id, game.away_id, True),
+                        (game.away_id, game.home_id, False)
+                    ):
+                        if school_id not in all_school_ids or school_id in school_current_games:
+                            continue
+                        school_current_games[school_id] = {
+                            'opponent': opponent_names.get(opponent_id) or 'TBD',
+                            'score': {
+                                'home': game.home_points or 0,
+                                'away': game.away_points or 0
+                            },
+                            'isHome': is_home,
+                            'status': game.status,  # Computed by the CASE in the query
+                            'week': game.week,
+                            'date': game.start_date.strftime('%m/%d %I:%M %p') if game.start_date else 'TBD'
+                        }
                 
-                print(f"🏈 Query 3: Got current games for {len(school_current_games)} schools")
+                logger.info("🏈 Query 3: Got current games for %s schools", len(school_current_games))
             else:
                 school_current_games = {}
             
@@ -245,23 +235,23 @@ def lambda_handler(event, context):
             # Sort by wins descending, then by display name
             members.sort(key=lambda x: (-x['wins'], x['displayName']))
             
-            print(f"✅ OPTIMIZED: Returning {len(members)} members (used ~4 queries instead of ~144)")
+            logger.info("✅ OPTIMIZED: Returning %s members (used ~4 queries instead of ~144)", len(members))
             
-            return success_response({
+            standings = {
                 'id': str(league.id),
                 'name': league.name,
                 'season': league.season,
                 'status': league.status,
                 'createdBy': str(league.created_by),
                 'members': members
-            })
+            }
+            set_cached_json(league_standings_key(league_id), standings, STANDINGS_CACHE_TTL_SECONDS)
+            
+            return etag_response(event, standings)
             
         finally:
             db.close()
             
     except Exception as e:
-        print(f"Get standings error: {str(e)}")
-        print(f"Get standings error type: {type(e)}")
-        import traceback
-        print(f"Get standings traceback: {traceback.format_exc()}")
+        log_exception("Get standings", e)
         return error_response('Failed to get standings', 500)
@@ -1,13 +1,15 @@
-import json
-import sys
-import os
+import logging
+from datetime import datetime
 
 # Import from layer
-from shared.database import get_db_session, League, User, LeagueTeam, LeagueTeamSchoolAssignment, School, Game
-from shared.responses import success_response, error_response, not_found_response
-from shared.auth import require_auth, get_user_id_from_event
-from sqlalchemy.orm import joinedload
-from sqlalchemy import and_, or_, text
+from shared.database import get_db_session, in_array, strict_loading_options, League, LeagueTeam, LeagueTeamSchoolAssignment, School
+from shared.responses import success_response, error_response, not_found_response, log_exception
+from shared.week_utils import get_current_week_of_season
+from sqlalchemy.orm import selectinload
+from sqlalchemy import text
+
+# Per-row details are debug level so CloudWatch only gets them when asked for
+logger = logging.getLogger(__name__)
 
 def lambda_handler(event, context):
     """Get league standings with win calculations - PUBLIC API"""
@@ -18,10 +20,12 @@ def lambda_handler(event, context):
         
         db = get_db_session()
         try:
-            # Get league with members and their teams
+            # Get league with members and their teams - one SELECT per relationship level
+            # rather than a single members x assignments cartesian join
             league = db.query(League)\
-                .options(joinedload(League.league_teams).joinedload(LeagueTeam.user))\
-                .options(joinedload(League.league_teams).joinedload(LeagueTeam.school_assignments).joinedload(LeagueTeamSchoolAssignment.school))\
+                .options(selectinload(League.league_teams).selectinload(LeagueTeam.user))\
+                .options(selectinload(League.league_teams).selectinload(LeagueTeam.school_assignments).selectinload(LeagueTeamSchoolAssignment.school))\
+                .options(*strict_loading_options())\
                 .filter(League.id == league_id)\
                 .first()
             
@@ -30,26 +34,86 @@ def lambda_handler(event, context):
             
             # Public API - no membership check required
             
-            # Get all league members first (even if they haven't drafted teams yet)
-            league_members = db.query(LeagueTeam).filter(
-                LeagueTeam.league_id == league_id
-            ).all()
+            # All league members (even if they haven't drafted teams yet), loaded with the league
+            league_members = league.league_teams
+            
+            logger.debug("Found %s league members", len(league_members))
+            
+            # Win/loss records for every school drafted in this league, in one grouped query
+            drafted_school_ids = [
+                assignment.school_id
+                for league_team in league_members
+                for assignment in league_team.school_assignments
+            ]
+            school_records = {}
+            if drafted_school_ids:
+                records_query = text("""
+                    SELECT school_id,
+                           SUM(CASE WHEN won THEN 1 ELSE 0 END) AS wins,
+                           COUNT(*) AS games
+                    FROM (
+                        SELECT home_id AS school_id, home_points > away_points AS won
+                        FROM games WHERE season = :season AND completed = true
+                        UNION ALL
+                        SELECT away_id AS school_id, away_points > home_points AS won
+                        FROM games WHERE season = :season AND completed = true
+                    ) results
+                    WHERE school_id = ANY(:school_ids)
+                    GROUP BY school_id
+                """)
+                for record in db.execute(records_query, {'season': league.season, 'school_ids': drafted_school_ids}):
+                    school_records[record.school_id] = (int(record.wins), int(record.games))
+            
+            # Current (or most recent) game and its opponent for every drafted school, batched
+            # instead of looked up per school - the current week is the same for all of them
+            current_week = get_current_week_of_season(league.season)
+            recent_games = {}
+            opponents = {}
+            if drafted_school_ids:
+                # One row per drafted school: its current week game if it has one,
+                # otherwise its latest game of the season
+                recent_games_query = text("""
+                    SELECT s.id AS school_id, g.home_id, g.away_id, g.home_points, g.away_points,
+                           g.completed, g.start_date, g.week
+                    FROM unnest(CAST(:school_ids AS integer[])) AS s(id)
+                    JOIN LATERAL (
+                        SELECT *
+                        FROM games
+                        WHERE season = :season AND (home_id = s.id OR away_id = s.id)
+                        ORDER BY (week = :current_week) DESC, week DESC
+                        LIMIT 1
+                    ) g ON true
+                """)
+                recent_games = {
+                    game.school_id: game
+                    for game in db.execute(recent_games_query, {
+                        'school_ids': drafted_school_ids,
+                        'season': league.season,
+                        'current_week': current_week
+                    })
+                }
+                
+                opponent_ids = {
+                    game.away_id if game.home_id == school_id else game.home_id
+                    for school_id, game in recent_games.items()
+                }
+                if opponent_ids:
+                    opponents = {
+                        school.id: school
+                        for school in db.query(School).filter(in_array(School.id, opponent_ids)).all()
+                    }
             
-            print(f"Debug: Found {len(league_members)} league members")
+            # One clock reading for every game status below
+            current_time = datetime.now()
             
             members = []
             for league_team in league_members:
                 user = league_team.user
                 
-                # Get user's drafted schools for this league
-                school_assignments = db.query(LeagueTeamSchoolAssignment).filter(
-                    and_(
-                        LeagueTeamSchoolAssignment.league_id == league_id,
-                        LeagueTeamSchoolAssignment.user_id == user.id
-                    )
-                ).all()
+                # User's drafted schools for this league, loaded with the league
+                school_assignments = league_team.school_assignments
                 
-                print(f"Debug: User {user.display_name} has {len(school_assignments)} drafted teams")
+                logger.debug("User %s has %s drafted teams", user.display_name, len(school_assignments))
                 
                 # Calculate wins for user's teams
                 total_wins = 0
@@ -60,68 +124,27 @@ def lambda_handler(event, context):
                 for assignment in school_assignments:
                     school = assignment.school
                     
-                    # Count wins for this school
-                    wins_query = db.query(Game).filter(
-                        and_(
-                            Game.season == league.season,
-                            Game.completed == True,
-                            or_(
-                                and_(Game.home_id == school.id, Game.home_points > Game.away_points),
-                                and_(Game.away_id == school.id, Game.away_points > Game.home_points)
-                            )
-                        )
-                    )
-                    school_wins = wins_query.count()
+                    # Wins and completed games for this school (no row = no completed games)
+                    school_wins, school_games = school_records.get(school.id, (0, 0))
                     total_wins += school_wins
                     
-                    # Count total completed games for this school
-                    games_query = db.query(Game).filter(
-                        and_(
-                            Game.season == league.season,
-                            Game.completed == True,
-                            or_(Game.home_id == school.id, Game.away_id == school.id)
-                        )
-                    )
-                    school_games = games_query.count()
                     school_losses = school_games - school_wins
                     total_losses += school_losses
                     total_games += school_games
                     
                     # Find current/recent game for this school
                     current_game = None
-                    # Get current week or most recent game for this school
-                    from shared.week_utils import get_current_week_of_season
-                    current_week = get_current_week_of_season(league.season)
-                    
-                    # Try to get current week game first
-                    recent_game = db.query(Game).filter(
-                        and_(
-                            Game.season == league.season,
-                            Game.week == current_week,
-                            or_(Game.home_id == school.id, Game.away_id == school.id)
-                        )
-                    ).first()
-                    
-                    # If no current week game, get most recent
-                    if not recent_game:
-                        recent_game = db.query(Game).filter(
-                            and_(
-                                Game.season == league.season,
-                                or_(Game.home_id == school.id, Game.away_id == school.id)
-                            )
-                        ).order_by(Game.week.desc()).first()
+                    recent_game = recent_games.get(school.id)
                     
                     if recent_game:
                         opponent_id = recent_game.away_id if recent_game.home_id == school.id else recent_game.home_id
-                        opponent = db.query(School).filter(School.id == opponent_id).first()
+                        opponent = opponents.get(opponent_id)
                         
                         # Determine game status
                         if recent_game.completed:
                             status = 'completed'
                         elif recent_game.start_date:
                             # Check if game has started - use timezone-naive comparison
-                            from datetime import datetime
-                            current_time = datetime.now()
                             # Make sure both are timezone-naive for comparison
                             game_start = recent_game.start_date
                             if hasattr(game_start, 'replace') and game_start.tzinfo is not None:
@@ -170,7 +193,7 @@ def lambda_handler(event, context):
             # Sort by wins descending, then by display name
             members.sort(key=lambda x: (-x['wins'], x['displayName']))
             
-            print(f"Debug: Returning {len(members)} members")
+            logger.debug("Returning %s members", len(members))
             
             return success_response({
                 'id': str(league.id),
@@ -185,8 +208,5 @@ def lambda_handler(event, context):
             db.close()
             
     except Exception as e:
-        print(f"Get standings error: {str(e)}")
-        print(f"Get standings error type: {type(e)}")
-        import traceback
-        print(f"Get standings traceback: {traceback.format_exc()}")
+        log_exception("Get standings", e)
         return error_response('Failed to get standings', 500)
@@ -1,12 +1,21 @@
 import json
 import sys
 import os
+import logging
 
 # Import from layer
 from shared.database import get_db_session, League, LeagueTeam, LeagueTeamSchoolAssignment, School, User, LeagueDraft
-from shared.responses import success_response, error_response, validation_error_response, not_found_response
+from shared.responses import success_response, error_response, validation_error_response, not_found_response, log_exception, parse_body
 from shared.auth import require_auth, get_user_id_from_event
-from sqlalchemy import and_, text
+from shared.cache import invalidate_league_cache
+from shared.connections import query_league_connections, post_to_connections
+from sqlalchemy import text, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
+
+# Draft progress is info level; LOG_LEVEL decides whether it reaches CloudWatch
+logger = logging.getLogger(__name__)
 
 @require_auth
 def lambda_handler(event, context):
@@ -16,7 +25,7 @@ def lambda_handler(event, context):
         if not event.get('body'):
             return validation_error_response({'body': 'Request body is required'})
         
-        body = json.loads(event['body'])
+        body = parse_body(event)
         league_id = body.get('leagueId')
         school_id = body.get('schoolId')
         user_id = get_user_id_from_event(event)
@@ -38,37 +47,41 @@ def lambda_handler(event, context):
             if not league:
                 return not_found_response('League')
             
-            # Verify school exists
-            school = db.query(School).filter(School.id == school_id).first()
+            # Verify school exists - only the columns the response and broadcast use
+            school = db.query(School)\
+                .options(load_only(
+                    School.id, School.name, School.mascot, School.conference,
+                    School.primary_color, School.secondary_color, School.abbreviation
+                ))\
+                .filter(School.id == school_id)\
+                .first()
             if not school:
                 return not_found_response('School')
             
-            # Check if school is already taken in this league
-            existing_pick = db.query(LeagueTeamSchoolAssignment).filter(
-                and_(LeagueTeamSchoolAssignment.league_id == league_id, 
-                     LeagueTeamSchoolAssignment.school_id == school_id)
-            ).first()
-            
-            if existing_pick:
-                return error_response('This team has already been selected by another player', 409)
+            # Everything the pick has to be validated against, in one round trip. Whether the
+            # school is taken is settled by the insert itself (ON CONFLICT), not read up front.
+            pick_state = db.execute(text("""
+                SELECT
+                    EXISTS (SELECT 1 FROM league_teams
+                            WHERE league_id = :league_id AND user_id = :user_id) AS is_member,
+                    (SELECT COUNT(*) FROM league_team_school_assignments
+                     WHERE league_id = :league_id AND user_id = :user_id) AS user_picks,
+                    (SELECT COUNT(*) FROM league_team_school_assignments
+                     WHERE league_id = :league_id) AS total_picks,
+                    (SELECT COUNT(*) FROM league_teams
+                     WHERE league_id = :league_id) AS total_players
+            """), {'league_id': league_id, 'user_id': user_id}).one()
             
             # Check league status - only allow picks in drafting leagues
             if league.status != 'drafting':
                 return error_response('Draft is not currently active for this league', 400)
             
             # Check if user has a team in this league
-            league_team = db.query(LeagueTeam).filter(
-                and_(LeagueTeam.league_id == league_id, LeagueTeam.user_id == user_id)
-            ).first()
-            
-            if not league_team:
+            if not pick_state.is_member:
                 return error_response('You are not a member of this league', 403)
             
             # Check if user has reached max teams for this league
-            user_school_count = db.query(LeagueTeamSchoolAssignment).filter(
-                and_(LeagueTeamSchoolAssignment.league_id == league_id, 
-                     LeagueTeamSchoolAssignment.user_id == user_id)
-            ).count()
+            user_school_count = pick_state.user_picks
             
             if user_school_count >= league.max_teams_per_user:
                 return error_response(f'You have reached the maximum of {league.max_teams_per_user} teams for this league', 400)
@@ -84,113 +97,121 @@ def lambda_handler(event, context):
             
             # Determine draft round and overall pick
             current_round = user_school_count + 1
-            total_picks = db.query(LeagueTeamSchoolAssignment).filter(
-                LeagueTeamSchoolAssignment.league_id == league_id
-            ).count()
-            draft_pick_overall = total_picks + 1
-            
-            # Create the school assignment
-            school_assignment = LeagueTeamSchoolAssignment(
-                league_id=league_id,
-                user_id=user_id,
-                school_id=school_id,
-                draft_round=current_round,
-                draft_pick_overall=draft_pick_overall
-            )
+            total_existing_picks = pick_state.total_picks
+            draft_pick_overall = total_existing_picks + 1
             
             # BEFORE adding the pick, check if this will be the final pick that completes the draft
-            league_teams = db.query(LeagueTeam).filter(LeagueTeam.league_id == league_id).all()
-            total_players = len(league_teams)
+            total_players = pick_state.total_players
             total_picks_needed = total_players * league.max_teams_per_user
             
-            # Count all existing committed picks in the league
-            total_existing_picks = db.query(LeagueTeamSchoolAssignment).filter(
-                LeagueTeamSchoolAssignment.league_id == league_id
-            ).count()
-            
             is_final_pick = (total_existing_picks + 1) == total_picks_needed
             
             if is_final_pick:
-                print(f"🚨🚨🚨 THIS IS THE FINAL PICK! 🚨🚨🚨")
-                print(f"🎯 Pick #{total_existing_picks + 1} of {total_picks_needed} total needed")
-                print(f"🏆 League {league_id} will be set to ACTIVE after this pick!")
-                print(f"👤 Final pick made by user: {user_id}")
-                print(f"🏫 Final school selected: {school_id}")
+                logger.info("🚨🚨🚨 THIS IS THE FINAL PICK! 🚨🚨🚨")
+                logger.info("🎯 Pick #%s of %s total needed", total_existing_picks + 1, total_picks_needed)
+                logger.info("🏆 League %s will be set to ACTIVE after this pick!", league_id)
+                logger.info("👤 Final pick made by user: %s", user_id)
+                logger.info("🏫 Final school selected: %s", school_id)
             
-            # Now add the pick to the transaction
-            db.add(school_assignment)
+            # Now add the pick to the transaction - a school already picked in this league
+            # inserts nothing, race-free thanks to UNIQUE(league_id, school_id)
+            try:
+                inserted_pick = db.execute(
+                    insert(LeagueTeamSchoolAssignment)
+                    .values(
+                        league_id=league_id,
+                        user_id=user_id,
+                        school_id=school_id,
+                        draft_round=current_round,
+                        draft_pick_overall=draft_pick_overall
+                    )
+                    .on_conflict_do_nothing(index_elements=['league_id', 'school_id'])
+                    .returning(LeagueTeamSchoolAssignment.drafted_at)
+                ).first()
+            except IntegrityError:
+                # Lost a race for this overall pick slot (e.g. a double-submitted pick) -
+                # UNIQUE(league_id, draft_pick_overall) rejects the duplicate
+                db.rollback()
+                return error_response('This pick was already recorded - refresh the draft board', 409)
+            
+            if inserted_pick is None:
+                db.rollback()
+                return error_response('This team has already been selected by another player', 409)
             
             # If this was the final pick, activate the league in the same transaction
             if is_final_pick:
-                print(f"✅ Setting league status to 'active'")
+                logger.info("✅ Setting league status to 'active'")
                 league.status = 'active'
                 
-                # Update draft completion if draft exists
-                draft = db.query(LeagueDraft).filter(LeagueDraft.league_id == league_id).first()
-                if draft:
-                    draft.completed_at = db.execute(text("SELECT NOW()")).scalar()
-                    draft.current_user_id = None
-                    draft.current_league_id = None
-                    print(f"✅ Draft marked as completed")
+                # Mark the draft (loaded for the turn check above) completed
+                draft.completed_at = func.now()  # Rendered into the UPDATE, no extra round trip
+                draft.current_user_id = None
+                draft.current_league_id = None
+                logger.info("✅ Draft marked as completed")
                 
-                print(f"✅ League {league_id} status updated to 'active'")
+                logger.info("✅ League %s status updated to 'active'", league_id)
             
             # Update draft state after successful pick (league is in drafting mode)
             elif league.status == 'drafting':
-                draft = db.query(LeagueDraft).filter(LeagueDraft.league_id == league_id).first()
-                if draft:
-                    # Advance to next pick
-                    draft.current_pick_overall += 1
+                # Advance to next pick
+                draft.current_pick_overall += 1
+                
+                # Find next player who hasn't completed their draft
+                league_teams_ordered = db.query(LeagueTeam).filter(
+                    LeagueTeam.league_id == league_id
+                ).order_by(LeagueTeam.draft_position).all()
+                
+                if league_teams_ordered:
+                    # Everyone's pick count in one grouped query rather than one count per
+                    # candidate. The pick was INSERTed above in this transaction, so it's included.
+                    pick_counts = {
+                        str(picker_id): count
+                        for picker_id, count in db.query(LeagueTeamSchoolAssignment.user_id, func.count())
+                        .filter(LeagueTeamSchoolAssignment.league_id == league_id)
+                        .group_by(LeagueTeamSchoolAssignment.user_id)
+                        .all()
+                    }
                     
-                    # Find next player who hasn't completed their draft
-                    league_teams_ordered = db.query(LeagueTeam).filter(
-                        LeagueTeam.league_id == league_id
-                    ).order_by(LeagueTeam.draft_position).all()
+                    total_users = len(league_teams_ordered)
+                    current_round = ((draft.current_pick_overall - 1) // total_users) + 1
+                    pick_in_round = (draft.current_pick_overall - 1) % total_users
                     
-                    if league_teams_ordered:
-                        total_users = len(league_teams_ordered)
+                    # Snake draft: reverse order on even rounds
+                    if current_round % 2 == 0:
+                        pick_in_round = total_users - 1 - pick_in_round
+                    
+                    # Find the next player who hasn't completed their draft
+                    attempts = 0
+                    while attempts < total_users:
+                        candidate_team = league_teams_ordered[pick_in_round]
+                        candidate_pick_count = pick_counts.get(str(candidate_team.user_id), 0)
+                        
+                        # If this player hasn't finished their draft, they're next
+                        if candidate_pick_count < league.max_teams_per_user:
+                            draft.current_user_id = candidate_team.user_id
+                            draft.current_league_id = league_id
+                            break
+                        
+                        # Move to next position in snake draft order
+                        draft.current_pick_overall += 1
                         current_round = ((draft.current_pick_overall - 1) // total_users) + 1
                         pick_in_round = (draft.current_pick_overall - 1) % total_users
                         
-                        # Snake draft: reverse order on even rounds
                         if current_round % 2 == 0:
                             pick_in_round = total_users - 1 - pick_in_round
                         
-                        # Find the next player who hasn't completed their draft
-                        attempts = 0
-                        while attempts < total_users:
-                            candidate_team = league_teams_ordered[pick_in_round]
-                            candidate_pick_count = db.query(LeagueTeamSchoolAssignment).filter(
-                                and_(LeagueTeamSchoolAssignment.league_id == league_id,
-                                     LeagueTeamSchoolAssignment.user_id == candidate_team.user_id)
-                            ).count()
-                            
-                            # If this player hasn't finished their draft, they're next
-                            if candidate_pick_count < league.max_teams_per_user:
-                                draft.current_user_id = candidate_team.user_id
-                                draft.current_league_id = league_id
-                                break
-                            
-                            # Move to next position in snake draft order
-                            draft.current_pick_overall += 1
-                            current_round = ((draft.current_pick_overall - 1) // total_users) + 1
-                            pick_in_round = (draft.current_pick_overall - 1) % total_users
-                            
-                            if current_round % 2 == 0:
-                                pick_in_round = total_users - 1 - pick_in_round
-                            
-                            attempts += 1
-                        
-                        # If we couldn't find anyone, draft is complete
-                        if attempts >= total_users:
-                            print(f"🎉 Draft complete! No more players need to pick.")
-                            league.status = 'active'
-                            draft.completed_at = db.execute(text("SELECT NOW()")).scalar()
-                            draft.current_user_id = None
-                            draft.current_league_id = None
+                        attempts += 1
+                    
+                    # If we couldn't find anyone, draft is complete
+                    if attempts >= total_users:
+                        logger.info("🎉 Draft complete! No more players need to pick.")
+                        league.status = 'active'
+                        draft.completed_at = func.now()  # Rendered into the UPDATE, no extra round trip
+                        draft.current_user_id = None
+                        draft.current_league_id = None
             
             db.commit()
-            db.refresh(school_assignment)
+            invalidate_league_cache(league_id)
             
             # Send WebSocket notification to all league members
             try:
@@ -203,7 +224,7 @@ def lambda_handler(event, context):
                 
                 if is_local_dev:
                     # Local development - broadcasting handled by dev_server.py
-                    print(f"📍 Local dev mode - draft update will be broadcast by dev server for league {league_id}")
+                    logger.info("📍 Local dev mode - draft update will be broadcast by dev server for league %s", league_id)
                     # In local development, the dev_server.py intercepts /teams/select and handles WebSocket broadcasting
                     # No additional action needed here - skip the entire AWS WebSocket logic
                     pass
@@ -225,10 +246,7 @@ def lambda_handler(event, context):
                         table_name = os.environ.get('CONNECTIONS_TABLE', f'{stage}-websocket-connections')
                         connections_table = dynamodb.Table(table_name)
                         
-                        response = connections_table.scan(
-                            FilterExpression='league_id = :league_id',
-                            ExpressionAttributeValues={':league_id': str(league_id)}
-                        )
+                        connections = query_league_connections(connections_table, league_id)
                         
                         # Determine message type based on league status
                         update_type = 'draft_complete' if league.status == 'active' else 'team_selected'
@@ -255,21 +273,16 @@ def lambda_handler(event, context):
                             'timestamp': datetime.utcnow().isoformat()
                         }
                         
-                        for item in response['Items']:
-                            connection_id = item['connection_id']
-                            try:
-                                api_gateway.post_to_connection(
-                                    ConnectionId=connection_id,
-                                    Data=json.dumps(message)
-                                )
-                            except api_gateway.exceptions.GoneException:
-                                # Connection is stale, remove it
-                                connections_table.delete_item(Key={'connection_id': connection_id})
-                            except Exception as e:
-                                print(f"Error sending to connection {connection_id}: {str(e)}")
+                        # Send to every connection concurrently; stale ones are removed
+                        post_to_connections(
+                            api_gateway,
+                            connections_table,
+                            [item['connection_id'] for item in connections],
+                            json.dumps(message)
+                        )
                             
             except Exception as e:
-                print(f"Error sending WebSocket notification: {str(e)}")
+                logger.warning("Error sending WebSocket notification: %s", e)
                 # Don't fail the request if WebSocket notification fails
             
             return success_response({
@@ -287,7 +300,7 @@ def lambda_handler(event, context):
                 },
                 'draftRound': current_round,
                 'draftPickOverall': draft_pick_overall,
-                'pickedAt': school_assignment.drafted_at.isoformat()
+                'pickedAt': inserted_pick.drafted_at.isoformat()
             }, 201)
             
         finally:
@@ -296,8 +309,5 @@ def lambda_handler(event, context):
     except json.JSONDecodeError:
         return validation_error_response({'body': 'Invalid JSON format'})
     except Exception as e:
-        print(f"Team selection error: {str(e)}")
-        print(f"Team selection error type: {type(e)}")
-        import traceback
-        print(f"Team selection traceback: {traceback.format_exc()}")
+        log_exception("Team selection", e)
         return error_response('Failed to select team', 500)
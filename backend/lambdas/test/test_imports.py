@@ -1,3 +1,4 @@
+import importlib
 import json
 import sys
 import traceback
@@ -23,7 +24,7 @@ def lambda_handler(event, context):
     
     for module_name, import_name in test_modules:
         try:
-            exec(f"import {import_name}")
+            importlib.import_module(import_name)
             results["imports"][module_name] = "✅ SUCCESS"
         except Exception as e:
             results["imports"][module_name] = f"❌ FAILED: {str(e)}"
@@ -40,7 +41,7 @@ def lambda_handler(event, context):
     
     for module_name, import_name in shared_modules:
         try:
-            exec(f"from {import_name} import *")
+            importlib.import_module(import_name)
             results["imports"][module_name] = "✅ SUCCESS"
         except Exception as e:
             results["imports"][module_name] = f"❌ FAILED: {str(e)}"
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 import logging
 from shared.database import get_db_connection, LeagueDraft, League, LeagueTeam, User
 from shared.auth import verify_jwt_token
+from shared.connections import query_league_connections, post_to_connections
 from sqlalchemy.orm import sessionmaker
 
 logger = logging.getLogger()
@@ -227,36 +228,20 @@ def broadcast_to_league(league_id, message, exclude_connection_id=None):
     """Broadcast a message to all connections subscribed to a league"""
     try:
         # Get all connections for this league
-        response = connections_table.scan(
-            FilterExpression='league_id = :league_id',
-            ExpressionAttributeValues={':league_id': league_id}
-        )
+        connections = query_league_connections(connections_table, league_id)
         
         api_gateway = get_api_gateway_management_api()
-        successful_sends = 0
-        failed_sends = 0
         
-        for item in response['Items']:
-            connection_id = item['connection_id']
-            
-            # Skip excluded connection
-            if exclude_connection_id and connection_id == exclude_connection_id:
-                continue
-            
-            try:
-                api_gateway.post_to_connection(
-                    ConnectionId=connection_id,
-                    Data=json.dumps(message)
-                )
-                successful_sends += 1
-            except api_gateway.exceptions.GoneException:
-                # Connection is stale, remove it
-                connections_table.delete_item(Key={'connection_id': connection_id})
-                logger.info(f"Removed stale connection: {connection_id}")
-                failed_sends += 1
-            except Exception as e:
-                logger.error(f"Error sending to connection {connection_id}: {str(e)}")
-                failed_sends += 1
+        # Send to every connection except the excluded one concurrently; stale ones are removed
+        successful_sends, failed_sends = post_to_connections(
+            api_gateway,
+            connections_table,
+            [
+                item['connection_id'] for item in connections
+                if not (exclude_connection_id and item['connection_id'] == exclude_connection_id)
+            ],
+            json.dumps(message)
+        )
         
         logger.info(f"Broadcast to league {league_id}: {successful_sends} successful, {failed_sends} failed")
         return successful_sends
@@ -0,0 +1,19 @@
+-- Migration script to add per-team season indexes on games
+-- Standings look up a school's games by season and home_id OR away_id; these let
+-- Postgres answer each side with an index-only scan (BitmapOr for the OR form)
+-- Run outside a transaction block: CREATE INDEX CONCURRENTLY doesn't lock out writes
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_games_season_home
+    ON games(season, home_id) INCLUDE (completed, home_points, away_points, week, start_date);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_games_season_away
+    ON games(season, away_id) INCLUDE (completed, home_points, away_points, week, start_date);
+
+-- league_team_school_assignments (league_id, school_id) lookups are already served by
+-- its UNIQUE(league_id, school_id) constraint index
+
+-- Verify the indexes were added correctly
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'games'
+ORDER BY indexname;
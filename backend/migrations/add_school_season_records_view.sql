@@ -0,0 +1,28 @@
+-- Migration script to add the school_season_records materialized view
+-- Precomputes each school's completed-game record per season so standings read a few
+-- indexed rows instead of aggregating the season's games on every request.
+-- The game loaders refresh it after each load (REFRESH ... CONCURRENTLY needs the unique index)
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS school_season_records AS
+SELECT
+    games.season,
+    sides.school_id,
+    COUNT(*) FILTER (WHERE sides.is_win) AS wins,
+    COUNT(*) - COUNT(*) FILTER (WHERE sides.is_win) AS losses,
+    COUNT(*) AS total_games
+FROM games
+CROSS JOIN LATERAL (VALUES
+    (games.home_id, games.home_points > games.away_points),
+    (games.away_id, games.away_points > games.home_points)
+) AS sides(school_id, is_win)
+WHERE games.completed = true
+GROUP BY games.season, sides.school_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_school_season_records_season_school
+    ON school_season_records(season, school_id);
+
+-- Verify the view was populated
+SELECT season, COUNT(*) AS schools, SUM(total_games) AS school_games
+FROM school_season_records
+GROUP BY season
+ORDER BY season;
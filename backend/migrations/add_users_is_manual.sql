@@ -0,0 +1,15 @@
+-- Migration script to add an is_manual flag to users
+-- Lets league settings identify manual (dummy) teams without loading emails
+
+ALTER TABLE users
+ADD COLUMN IF NOT EXISTS is_manual BOOLEAN DEFAULT FALSE;
+
+-- Backfill dummy users created by add_manual_team
+UPDATE users
+SET is_manual = TRUE
+WHERE email LIKE '%@cfbpick6.internal';
+
+-- Verify the backfill
+SELECT is_manual, COUNT(*) AS user_count
+FROM users
+GROUP BY is_manual;
@@ -21,6 +21,7 @@ CREATE TABLE IF NOT EXISTS users (
     email VARCHAR(255) UNIQUE NOT NULL,
     password_hash VARCHAR(255) NOT NULL,
     display_name VARCHAR(100) NOT NULL,
+    is_manual BOOLEAN DEFAULT FALSE, -- placeholder users created by add_manual_team
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -116,6 +117,8 @@ CREATE TABLE IF NOT EXISTS league_drafts (
 CREATE INDEX IF NOT EXISTS idx_games_season_week ON games(season, week);
 CREATE INDEX IF NOT EXISTS idx_games_teams ON games(home_id, away_id);
 CREATE INDEX IF NOT EXISTS idx_games_completed ON games(completed);
+CREATE INDEX IF NOT EXISTS idx_games_season_home ON games(season, home_id) INCLUDE (completed, home_points, away_points, week, start_date);
+CREATE INDEX IF NOT EXISTS idx_games_season_away ON games(season, away_id) INCLUDE (completed, home_points, away_points, week, start_date);
 CREATE INDEX IF NOT EXISTS idx_league_teams_league ON league_teams(league_id);
 CREATE INDEX IF NOT EXISTS idx_league_teams_user ON league_teams(user_id);
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
@@ -148,5 +151,23 @@ LEFT JOIN games g ON (g.home_id = ltsa.school_id OR g.away_id = ltsa.school_id)
 GROUP BY lt.league_id, lt.user_id, u.display_name, lt.team_name, lt.draft_position
 ORDER BY wins DESC, games_played ASC;
 
+-- Completed-game record per (season, school) for standings; refreshed by the game loaders
+CREATE MATERIALIZED VIEW IF NOT EXISTS school_season_records AS
+SELECT
+    games.season,
+    sides.school_id,
+    COUNT(*) FILTER (WHERE sides.is_win) AS wins,
+    COUNT(*) - COUNT(*) FILTER (WHERE sides.is_win) AS losses,
+    COUNT(*) AS total_games
+FROM games
+CROSS JOIN LATERAL (VALUES
+    (games.home_id, games.home_points > games.away_points),
+    (games.away_id, games.away_points > games.home_points)
+) AS sides(school_id, is_win)
+WHERE games.completed = true
+GROUP BY games.season, sides.school_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_school_season_records_season_school ON school_season_records(season, school_id);
+
 -- Note: Schools and games data should be loaded via the data loading scripts
 -- to avoid API rate limits and ensure consistency
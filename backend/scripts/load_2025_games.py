@@ -15,6 +15,7 @@ from typing import List, Dict
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'layers', 'shared', 'python'))
 
 from shared.database import get_db_session, Game, School
+from sqlalchemy import text
 # from shared.parameter_store import get_cfb_api_key
 
 # CollegeFootballData API configuration
@@ -172,6 +173,11 @@ def main():
             # Final commit
             db.commit()
             
+            # Recompute the school_season_records view that standings read from
+            # (the layers/ copy of shared predates game_utils.refresh_school_season_records)
+            db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY school_season_records"))
+            db.commit()
+            
             print("\n✅ Games loading completed!")
             print(f"   Games added: {games_added}")
             print(f"   Games skipped: {games_skipped}")
@@ -39,6 +39,7 @@ load_local_env()
 from lambdas.admin.games_load import lambda_handler as games_load_handler
 from lambdas.shared.week_utils import get_current_week_of_season, get_week_info
 from lambdas.shared.database import get_db_session, Game, School
+from lambdas.shared.game_utils import refresh_school_season_records
 from sqlalchemy import and_, or_
 
 def load_current_week_games_from_api(season=2025):
@@ -137,6 +138,7 @@ def update_games_in_database(api_games, season, live_mode=False):
                 updated_count += 1
         
         db.commit()
+        refresh_school_season_records(db)
         data_source = "mock data" if live_mode else "real data from CFB API"
         print(f"✅ Updated {updated_count} games with {data_source}")
         
@@ -265,6 +267,9 @@ def simulate_game_updates(games, max_updates=2):
                     'status': status
                 })
         
+        # Recompute school records once for all the updates above
+        refresh_school_season_records(db)
+        
         return updated_games
         
     except Exception as e: